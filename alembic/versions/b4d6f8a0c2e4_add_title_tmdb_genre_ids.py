@@ -0,0 +1,36 @@
+"""add title tmdb genre ids
+
+Revision ID: b4d6f8a0c2e4
+Revises: a2c4e6f8b0d2
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "b4d6f8a0c2e4"
+down_revision: str | None = "a2c4e6f8b0d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "titles",
+        sa.Column("tmdb_genre_ids", postgresql.ARRAY(sa.Integer()), nullable=True),
+    )
+    op.create_index(
+        "ix_titles_tmdb_genre_ids",
+        "titles",
+        ["tmdb_genre_ids"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_titles_tmdb_genre_ids", table_name="titles")
+    op.drop_column("titles", "tmdb_genre_ids")
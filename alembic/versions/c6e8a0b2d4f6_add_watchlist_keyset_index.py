@@ -0,0 +1,28 @@
+"""add watchlist keyset index
+
+Revision ID: c6e8a0b2d4f6
+Revises: b4d6f8a0c2e4
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "c6e8a0b2d4f6"
+down_revision: str | None = "b4d6f8a0c2e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_watchlist_items_group_created_id",
+        "watchlist_items",
+        ["group_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_watchlist_items_group_created_id", table_name="watchlist_items")
@@ -0,0 +1,29 @@
+"""add title name trigram index
+
+Revision ID: d8f0b2c4e6a8
+Revises: c6e8a0b2d4f6
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "d8f0b2c4e6a8"
+down_revision: str | None = "c6e8a0b2d4f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Lets the watchlist `name ILIKE '%term%'` search use an index instead of a scan.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_titles_name_trgm "
+        "ON titles USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_titles_name_trgm")
@@ -0,0 +1,29 @@
+"""add title name lower index
+
+Revision ID: e0a2c4e6f8b0
+Revises: d8f0b2c4e6a8
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e0a2c4e6f8b0"
+down_revision: str | None = "d8f0b2c4e6a8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_titles_name_lower",
+        "titles",
+        [sa.text("lower(name)")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_titles_name_lower", table_name="titles")
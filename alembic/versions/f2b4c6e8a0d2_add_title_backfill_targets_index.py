@@ -0,0 +1,33 @@
+"""add title backfill targets index
+
+Revision ID: f2b4c6e8a0d2
+Revises: e0a2c4e6f8b0
+Create Date: 2026-10-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f2b4c6e8a0d2"
+down_revision: str | None = "e0a2c4e6f8b0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_titles_backfill_targets",
+        "titles",
+        ["id"],
+        postgresql_where=sa.text(
+            "source = 'tmdb' AND source_id IS NOT NULL"
+            " AND (runtime_minutes IS NULL OR overview IS NULL OR length(btrim(overview)) = 0)"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_titles_backfill_targets", table_name="titles")
@@ -33,8 +33,10 @@ from app.api.routes.feedback import router as feedback_router
 from app.api.routes.group_insights import router as group_insights_router
 from app.api.routes.movie_presentation import router as movie_presentation_router
 from app.middleware.feedback_body_limit import FeedbackBodyLimitMiddleware
+from app.middleware.membership_cache import MembershipCacheMiddleware
 from app.middleware.security_boundary import SecurityBoundaryMiddleware
 from app.services.feedback_rate_limit import close_feedback_rate_limiter
+from app.services.tmdb import close_tmdb_clients
 
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,7 @@ logger = logging.getLogger(__name__)
 async def lifespan(_: FastAPI):
     yield
     await close_feedback_rate_limiter()
+    await close_tmdb_clients()
 
 
 app = FastAPI(
@@ -83,6 +86,8 @@ if SessionMiddleware is not None:
         https_only=settings.auth_cookie_secure_value(),
     )
 
+app.add_middleware(MembershipCacheMiddleware)
+
 app.add_middleware(
     FeedbackBodyLimitMiddleware,
     max_bytes=16 * 1024,
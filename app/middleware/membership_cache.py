@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from app.services.watchlist import verified_memberships
+
+
+class MembershipCacheMiddleware:
+    """Give each HTTP request its own memo of verified group memberships."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = verified_memberships.set(set())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            verified_memberships.reset(token)
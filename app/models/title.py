@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
@@ -28,6 +28,8 @@ class Title(Base):
 
     overview: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
     runtime_minutes: Mapped[int | None] = mapped_column(sa.Integer, nullable=True)
+    # TMDB genre ids, stored so watchlist genre filters run in SQL; None = not fetched yet.
+    tmdb_genre_ids: Mapped[list[int] | None] = mapped_column(ARRAY(sa.Integer), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False)
 
@@ -37,4 +39,17 @@ class Title(Base):
         sa.CheckConstraint("media_type IN ('movie','tv')", name="ck_titles_media_type"),
         sa.UniqueConstraint("source", "source_id", "media_type", name="uq_titles_source_source_id_media_type"),
         sa.Index("ix_titles_source_source_id", "source", "source_id"),
+        sa.Index("ix_titles_tmdb_genre_ids", "tmdb_genre_ids", postgresql_using="gin"),
+        sa.Index("ix_titles_name_lower", sa.func.lower(name)),
+        # Matches the TMDB details backfill scan, so repeated batches skip already-filled rows.
+        sa.Index(
+            "ix_titles_backfill_targets",
+            "id",
+            postgresql_where=sa.text(
+                "source = 'tmdb' AND source_id IS NOT NULL"
+                " AND (runtime_minutes IS NULL OR overview IS NULL OR length(btrim(overview)) = 0)"
+            ),
+        ),
+        # ix_titles_name_trgm (pg_trgm, for name ILIKE search) is created by migration only,
+        # so metadata.create_all does not depend on the extension being installed.
     )
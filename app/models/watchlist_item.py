@@ -38,4 +38,5 @@ class WatchlistItem(Base):
         sa.UniqueConstraint("group_id", "title_id", name="uq_watchlist_items_group_title"),
         sa.Index("ix_watchlist_items_group_status", "group_id", "status"),
         sa.Index("ix_watchlist_items_group_snoozed", "group_id", "snoozed_until"),
+        sa.Index("ix_watchlist_items_group_created_id", "group_id", "created_at", "id"),
     )
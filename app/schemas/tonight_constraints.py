@@ -71,3 +71,10 @@ class TonightConstraints(BaseModel):
             # keep it consistent: if not parsed by AI, ai_version must be null
             self.ai_version = None
         return self
+
+    def canonical_bytes(self) -> bytes:
+        """Stable signature of the constraint values, in declared field order."""
+        return b"|".join(
+            f"{name}={getattr(self, name)!r}".encode("utf-8")
+            for name in type(self).model_fields
+        )
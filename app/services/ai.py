@@ -14,6 +14,7 @@ from app.schemas.tonight_constraints import TonightConstraints
 
 OPENAI_RESPONSES_URL = "https://api.openai.com/v1/responses"
 OPENAI_TIMEOUT_SECONDS = 8.0
+_COMPACT_JSON = {"separators": (",", ":"), "ensure_ascii": True}
 
 logger = logging.getLogger(__name__)
 
@@ -68,11 +69,13 @@ async def _post_openai_json(payload: dict[str, Any]) -> dict[str, Any]:
     except AIError as exc:
         _log_failure(correlation_id, str(exc), exc)
         raise
+    # Encode once; the retry reuses the same body bytes.
+    body = json.dumps(payload, **_COMPACT_JSON).encode("ascii")
 
     for attempt in range(2):
         try:
             async with httpx.AsyncClient(timeout=OPENAI_TIMEOUT_SECONDS) as client:
-                resp = await client.post(OPENAI_RESPONSES_URL, headers=headers, json=payload)
+                resp = await client.post(OPENAI_RESPONSES_URL, headers=headers, content=body)
 
             status = resp.status_code
             if status in (408, 429) or status >= 500:
@@ -128,7 +131,7 @@ Rules:
             "ui_constraints": baseline.model_dump(),
             "text": text,
         },
-        ensure_ascii=True,
+        **_COMPACT_JSON,
     )
 
     payload = {
@@ -200,7 +203,7 @@ Rules:
             "constraints": constraints.model_dump(),
             "candidates": candidates,
         },
-        ensure_ascii=True,
+        **_COMPACT_JSON,
     )
 
     payload = {
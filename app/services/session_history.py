@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.presenters.users import avatar_fields_from_user
+from app.models.title import Title
 from app.models.tonight_session import TonightSession
 from app.models.tonight_session_candidate import TonightSessionCandidate
 from app.models.tonight_session_participant import TonightSessionParticipant
@@ -166,11 +167,40 @@ def _candidate_by_source(session: TonightSession) -> dict[uuid.UUID, TonightSess
     return {candidate_source_id(row): row for row in session.candidates}
 
 
-def _ensure_candidate_metadata_snapshots(session: TonightSession) -> None:
-    """Fill migrated active candidates from their still-live watchlist relation."""
-    for candidate in session.candidates:
-        item = candidate.watchlist_item
-        title = item.title if item is not None else None
+_CANDIDATE_SNAPSHOT_FIELDS = (
+    "source_title_id",
+    "title_source",
+    "title_source_id",
+    "media_type",
+    "title_name",
+    "release_year",
+    "poster_path",
+    "runtime_minutes",
+    "overview",
+)
+
+
+async def _ensure_candidate_metadata_snapshots(
+    db: AsyncSession, session: TonightSession
+) -> None:
+    """Fill migrated active candidates from their still-live watchlist titles."""
+    # Any blank snapshot field is filled below, so any blank field makes a candidate pending.
+    pending = [
+        candidate
+        for candidate in session.candidates
+        if candidate.watchlist_item_id is not None
+        and not all(getattr(candidate, field) for field in _CANDIDATE_SNAPSHOT_FIELDS)
+    ]
+    if not pending:
+        return
+    rows = await db.execute(
+        select(WatchlistItem.id, Title)
+        .join(WatchlistItem.title)
+        .where(WatchlistItem.id.in_({candidate.watchlist_item_id for candidate in pending}))
+    )
+    titles = {item_id: title for item_id, title in rows.all()}
+    for candidate in pending:
+        title = titles.get(candidate.watchlist_item_id)
         if title is None:
             continue
         candidate.source_title_id = candidate.source_title_id or title.id
@@ -286,7 +316,7 @@ async def freeze_winner_result(
     had_tie: bool | None,
     tie_resolution: str | None,
 ) -> None:
-    _ensure_candidate_metadata_snapshots(session)
+    await _ensure_candidate_metadata_snapshots(db, session)
     winner = _apply_candidate_outcomes(session, runtime, winner_source_id)
     participants = await _ensure_participant_snapshots(
         db, session=session, runtime=runtime
@@ -459,7 +489,7 @@ async def list_group_movie_nights(
 
 
 def completed_session_out(session: TonightSession) -> CompletedSessionOut:
-    candidates = sorted(session.candidates, key=lambda row: row.position)
+    candidates = list(session.candidates)
     winner_selected_at = session.winner_selected_at or session.completed_at
     if winner_selected_at is None or session.winner_candidate_id is None:
         raise ValueError("Completed movie night snapshot is incomplete")
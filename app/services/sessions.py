@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import random
 import re
 import uuid
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -13,11 +13,13 @@ from urllib.parse import urlparse
 
 import sqlalchemy as sa
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, lazyload, selectinload
 
 from app.api.presenters.users import avatar_fields_from_user
 from app.models.group_membership import GroupMembership
+from app.models.title import Title
 from app.models.tonight_session import TonightSession
 from app.models.tonight_session_candidate import TonightSessionCandidate
 from app.models.tonight_vote import TonightVote
@@ -44,9 +46,10 @@ def _canonicalize_constraints(payload: dict) -> TonightConstraints:
     return c
 
 
-def _stable_seed(value: str) -> int:
-    digest = hashlib.sha256(value.encode("utf-8")).digest()
-    return int.from_bytes(digest[:4], "big")
+def _stable_seed(value: str | bytes) -> int:
+    # The seed only feeds random.Random, so a CRC is plenty.
+    data = value.encode("utf-8") if isinstance(value, str) else value
+    return zlib.crc32(data)
 
 
 _WORD_RE = re.compile(r"[a-z0-9]+")
@@ -718,13 +721,13 @@ async def _build_ai_candidate_payload(
 
     await asyncio.gather(*[_enrich(idx, it) for idx, it in enumerate(items)])
 
+    # Constraints travel once beside the candidate list, so rows only carry
+    # per-title fields; missing enrichment shares one empty default.
+    no_taxonomy = ((), (), ())
     payload: list[dict[str, Any]] = []
     for it in items:
         t = it.title
-        tmdb_genres, tmdb_keywords, tmdb_genre_ids = taxonomy_map.get(
-            it.id,
-            (set(), set(), set()),
-        )
+        tmdb_genres, tmdb_keywords, tmdb_genre_ids = taxonomy_map.get(it.id, no_taxonomy)
         payload.append(
             {
                 "id": str(it.id),
@@ -736,10 +739,10 @@ async def _build_ai_candidate_payload(
                 "tmdb_genres": sorted(tmdb_genres),
                 "tmdb_keywords": sorted(tmdb_keywords),
                 "tmdb_genre_ids": sorted(tmdb_genre_ids),
-                "tmdb_people": sorted(people_map.get(it.id, set())),
-                "tmdb_companies": sorted(company_map.get(it.id, set())),
-                "web_companies": sorted(web_company_map.get(it.id, set())),
-                "tmdb_locale_tokens": sorted(locale_map.get(it.id, set())),
+                "tmdb_people": sorted(people_map.get(it.id, ())),
+                "tmdb_companies": sorted(company_map.get(it.id, ())),
+                "web_companies": sorted(web_company_map.get(it.id, ())),
+                "tmdb_locale_tokens": sorted(locale_map.get(it.id, ())),
             }
         )
 
@@ -1505,49 +1508,36 @@ def _sort_with_mood_matches(
     if not items:
         return []
 
-    def _score(it: WatchlistItem) -> int:
-        return len(matched.get(it.id, []))
-
-    any_positive = any(_score(it) > 0 for it in items)
-    if any_positive:
-        items = [it for it in items if _score(it) > 0]
-
-    def _tie_break(it: WatchlistItem) -> int:
-        h = hashlib.sha256(f"{seed}:{it.id}".encode("utf-8")).digest()
-        return int.from_bytes(h[:4], "big")
-
-    return sorted(items, key=lambda it: (-_score(it), _tie_break(it)))
-
-
-def _apply_hard_filters(items: list[WatchlistItem], c: TonightConstraints) -> list[WatchlistItem]:
-    out: list[WatchlistItem] = []
+    scores = {it.id: len(matched.get(it.id, [])) for it in items}
+    if any(scores.values()):
+        items = [it for it in items if scores[it.id] > 0]
 
-    for it in items:
-        t = it.title
-
-        # format filter
-        if c.format != "any" and t.media_type != c.format:
-            continue
-
-        # max_runtime filter (only if runtime known)
-        if c.max_runtime is not None and t.runtime_minutes is not None:
-            if t.runtime_minutes > c.max_runtime:
-                continue
+    # Per-item CRC tie-break keeps the order stable for a given seed without
+    # hashing every item through SHA-256.
+    return sorted(
+        items,
+        key=lambda it: (-scores[it.id], _stable_seed(f"{seed}:{it.id}")),
+    )
 
-        out.append(it)
 
-    return out
+def _hard_filter_clauses(c: TonightConstraints) -> list[sa.ColumnElement[bool]]:
+    clauses: list[sa.ColumnElement[bool]] = []
+    # format filter
+    if c.format != "any":
+        clauses.append(Title.media_type == c.format)
+    # max_runtime filter (only if runtime known)
+    if c.max_runtime is not None:
+        clauses.append(
+            sa.or_(Title.runtime_minutes.is_(None), Title.runtime_minutes <= c.max_runtime)
+        )
+    return clauses
 
 
-def _deterministic_shuffle(items: list[WatchlistItem], seed: int) -> list[WatchlistItem]:
-    # Use a deterministic shuffle for stable tests + predictable behavior.
+def _deterministic_topk(items: list[WatchlistItem], k: int, seed: int) -> list[WatchlistItem]:
+    # Deterministic pick for stable tests + predictable behavior.
     # This is NOT cryptographically secure; just stable ordering.
-    import random
-
-    r = random.Random(seed)
-    items2 = list(items)
-    r.shuffle(items2)
-    return items2
+    # random.sample only draws k picks and never shuffles the whole pool.
+    return random.Random(seed).sample(items, min(k, len(items)))
 
 
 SESSION_RUNTIME_KEY = "__session_runtime_v1"
@@ -1641,7 +1631,8 @@ def _normalize_watch_party_url(value: str | None) -> str | None:
 
 
 def _session_base_candidate_ids(s: TonightSession) -> list[uuid.UUID]:
-    return [candidate_source_id(c) for c in sorted(s.candidates, key=lambda x: x.position)]
+    # TonightSession.candidates is loaded in position order (relationship order_by).
+    return [candidate_source_id(c) for c in s.candidates]
 
 
 def _runtime_round_state(runtime: dict[str, Any], round_num: int) -> dict[str, Any]:
@@ -1813,6 +1804,14 @@ async def _group_member_ids(db: AsyncSession, *, group_id: uuid.UUID) -> list[uu
     return sorted(set(member_ids), key=str)
 
 
+def _session_rng(session_id: uuid.UUID, salt: str = "") -> random.Random:
+    # Seed from the UUID's integer value rather than hashing its string form.
+    seed = session_id.int
+    if salt:
+        seed ^= _stable_seed(salt)
+    return random.Random(seed)
+
+
 def _compute_round_winner(
     *,
     session_id: uuid.UUID,
@@ -1837,7 +1836,7 @@ def _compute_round_winner(
                 stats[item_id]["no"] += 1
 
     if all(v["yes"] == 0 and v["no"] == 0 for v in stats.values()):
-        rng = random.Random(f"{session_id}:round{round_num}")
+        rng = _session_rng(session_id, f"round{round_num}")
         selected = rng.choice(candidate_ids)
         return selected
 
@@ -1853,7 +1852,7 @@ def _compute_round_winner(
     if len(no_tied) == 1:
         return uuid.UUID(no_tied[0])
 
-    rng = random.Random(f"{session_id}:round{round_num}:tie")
+    rng = _session_rng(session_id, f"round{round_num}:tie")
     return uuid.UUID(rng.choice(sorted(no_tied)))
 
 
@@ -2007,28 +2006,36 @@ async def _generate_user_deck_items(
     else:
         refined.free_text = (text or "").strip()
 
+    # One joined query for item + title; the deck never reads added_by_user,
+    # so skip its default joined load of the whole users row.
     q = (
         select(WatchlistItem)
-        .options(selectinload(WatchlistItem.title))
+        .join(WatchlistItem.title)
+        .options(contains_eager(WatchlistItem.title), lazyload(WatchlistItem.added_by_user))
         .where(
             WatchlistItem.group_id == group_id,
             WatchlistItem.status == "watchlist",
             sa.or_(WatchlistItem.snoozed_until.is_(None), WatchlistItem.snoozed_until <= now),
+            *_hard_filter_clauses(refined),
         )
         .order_by(WatchlistItem.created_at.desc())
     )
     eligible = (await db.execute(q)).scalars().all()
-    filtered = _apply_hard_filters(eligible, refined)
     filtered = await _apply_free_text_strict_filters(
-        items=filtered,
+        items=eligible,
         constraints=refined,
     )
     if not filtered:
         return [], refined, False, None
 
-    seed_source = (
-        f"{group_id}:{(str(user_id) if user_id else 'anon')}:{now.date().isoformat()}:"
-        f"{json.dumps(refined.model_dump(), sort_keys=True)}"
+    # Raw UUID bytes are process-stable and skip formatting the ids as text.
+    seed_source = b":".join(
+        (
+            group_id.bytes,
+            user_id.bytes if user_id else b"anon",
+            now.date().isoformat().encode("ascii"),
+            refined.canonical_bytes(),
+        )
     )
     seed = _stable_seed(seed_source)
     requested_moods = _derive_requested_moods(refined)
@@ -2045,7 +2052,7 @@ async def _generate_user_deck_items(
         )
         prelim = ranked[:30]
     else:
-        prelim = _deterministic_shuffle(filtered, seed=seed)[:30]
+        prelim = _deterministic_topk(filtered, 30, seed)
 
     final_n = min(candidate_count, len(prelim))
     if final_n <= 0:
@@ -2063,28 +2070,19 @@ async def _generate_user_deck_items(
     if final_n > 1:
         try:
             rerank = await ai_rerank_candidates(constraints=refined, candidates=candidates_payload)
-            by_id = {str(it.id): it for it in prelim}
-            valid_ids = [item_id for item_id in rerank.ordered_ids if item_id in by_id]
+            by_id = {it.id: it for it in prelim}
+            valid_ids = [
+                item_id for item_id in _parse_uuid_list(rerank.ordered_ids) if item_id in by_id
+            ]
             min_valid = min(3, final_n)
             if len(valid_ids) >= min_valid and len(valid_ids) >= (final_n // 2 + 1):
-                seen: set[uuid.UUID] = set()
-                ordered: list[WatchlistItem] = []
-                for item_id in valid_ids:
-                    it = by_id.get(item_id)
-                    if not it or it.id in seen:
-                        continue
-                    seen.add(it.id)
-                    ordered.append(it)
-                    if len(ordered) == final_n:
-                        break
+                picked_ids = list(dict.fromkeys(valid_ids))[:final_n]
+                ordered = [by_id[item_id] for item_id in picked_ids]
                 if len(ordered) < final_n:
-                    for it in prelim:
-                        if it.id in seen:
-                            continue
-                        seen.add(it.id)
-                        ordered.append(it)
-                        if len(ordered) == final_n:
-                            break
+                    picked = set(picked_ids)
+                    ordered.extend(
+                        [it for it in prelim if it.id not in picked][: final_n - len(ordered)]
+                    )
                 final_order = ordered
                 ai_used = True
                 ai_why = rerank.why
@@ -2164,33 +2162,41 @@ async def _replace_session_candidates(
     )
     genres_by_id = dict(zip(candidate_ids, genre_rows, strict=True))
 
-    rows: list[TonightSessionCandidate] = []
+    params: list[dict[str, Any]] = []
     for pos, item_id in enumerate(candidate_ids):
         item = items_by_id.get(item_id)
         if item is None:
             raise ValueError("A session candidate is no longer in the watchlist")
         title = item.title
-        row = TonightSessionCandidate(
-            session_id=session_id,
-            watchlist_item_id=item_id,
-            source_watchlist_item_id=item_id,
-            source_title_id=title.id,
-            title_source=title.source,
-            title_source_id=title.source_id,
-            media_type=title.media_type,
-            title_name=title.name,
-            release_year=title.release_year,
-            poster_path=title.poster_path,
-            runtime_minutes=title.runtime_minutes,
-            genres=genres_by_id.get(item_id, []),
-            overview=title.overview,
-            position=pos,
-            ai_note=(notes_by_item_id or {}).get(item_id),
+        params.append(
+            {
+                "session_id": session_id,
+                "watchlist_item_id": item_id,
+                "source_watchlist_item_id": item_id,
+                "source_title_id": title.id,
+                "title_source": title.source,
+                "title_source_id": title.source_id,
+                "media_type": title.media_type,
+                "title_name": title.name,
+                "release_year": title.release_year,
+                "poster_path": title.poster_path,
+                "runtime_minutes": title.runtime_minutes,
+                "genres": genres_by_id.get(item_id, []),
+                "overview": title.overview,
+                "position": pos,
+                "ai_note": (notes_by_item_id or {}).get(item_id),
+            }
         )
-        db.add(row)
-        rows.append(row)
-    await db.flush()
-    return rows
+    if not params:
+        return []
+    # One multi-row INSERT ... RETURNING instead of a unit-of-work flush per row.
+    result = await db.scalars(
+        sa.insert(TonightSessionCandidate).returning(
+            TonightSessionCandidate, sort_by_parameter_order=True
+        ),
+        params,
+    )
+    return list(result.all())
 
 
 async def _finalize_collecting_to_swipe(
@@ -2250,10 +2256,7 @@ async def _finalize_collecting_to_swipe(
                     bucket.update(canonical_moods)
 
     if not ordered_ids:
-        ordered_ids = [
-            candidate_source_id(c)
-            for c in sorted(s.candidates, key=lambda c: c.position)
-        ]
+        ordered_ids = [candidate_source_id(c) for c in s.candidates]
 
     combined = _dedupe_uuid_sequence(ordered_ids)
     notes_by_item_id: dict[uuid.UUID, str] = {}
@@ -2389,9 +2392,12 @@ async def create_tonight_session(
             now=now,
         )
         collecting["user_decks"][str(user_id)] = [str(item.id) for item in deck_items]
-        collecting["user_constraints"][str(user_id)] = refined.model_dump()
+        # _persist_runtime copies sess.constraints before nesting the runtime,
+        # so both slots can share one dump without creating a cycle.
+        refined_dump = refined.model_dump()
+        collecting["user_constraints"][str(user_id)] = refined_dump
         collecting["user_ai"][str(user_id)] = {"used": bool(ai_used), "why": ai_why}
-        sess.constraints = refined.model_dump()
+        sess.constraints = refined_dump
         sess.ai_used = bool(sess.ai_used or ai_used)
         if ai_used and ai_why:
             sess.ai_why = ai_why
@@ -2442,10 +2448,19 @@ async def create_tonight_session(
 
 
 
+def _session_candidates_loader(with_titles: bool = True):
+    if not with_titles:
+        # Vote paths only need candidate ids and snapshot columns.
+        return selectinload(TonightSession.candidates).lazyload(TonightSessionCandidate.watchlist_item)
+    return selectinload(TonightSession.candidates).selectinload(TonightSessionCandidate.watchlist_item).selectinload(WatchlistItem.title)
+
+
+# lambda_stmt caches the built statement and its compiled SQL per code location;
+# the closed-over ids become bound parameters on each call.
 async def _load_session_with_candidates(db: AsyncSession, session_id: uuid.UUID) -> TonightSession:
-    q = (
-        select(TonightSession)
-        .options(selectinload(TonightSession.candidates).selectinload(TonightSessionCandidate.watchlist_item).selectinload(WatchlistItem.title))
+    q = sa.lambda_stmt(
+        lambda: select(TonightSession)
+        .options(_session_candidates_loader())
         .where(TonightSession.id == session_id)
     )
     s = (await db.execute(q)).scalar_one_or_none()
@@ -2454,6 +2469,36 @@ async def _load_session_with_candidates(db: AsyncSession, session_id: uuid.UUID)
     return s
 
 
+async def _load_session_if_member(
+    db: AsyncSession,
+    session_id: uuid.UUID,
+    user_id: uuid.UUID,
+    *,
+    with_titles: bool = True,
+) -> TonightSession:
+    q = sa.lambda_stmt(
+        lambda: select(TonightSession).options(_session_candidates_loader(with_titles)),
+        track_on=[with_titles],
+    )
+    q += lambda stmt: stmt.where(
+        TonightSession.id == session_id,
+        sa.exists().where(
+            GroupMembership.group_id == TonightSession.group_id,
+            GroupMembership.user_id == user_id,
+        ),
+    )
+    s = (await db.execute(q)).scalar_one_or_none()
+    if s is not None:
+        return s
+    # Only the failure path pays for a second lookup to pick the right error.
+    found = (
+        await db.execute(select(TonightSession.id).where(TonightSession.id == session_id))
+    ).scalar_one_or_none()
+    if found is None:
+        raise ValueError("Session not found")
+    raise PermissionError("Not a member of this group")
+
+
 async def _assert_session_active(s: TonightSession) -> None:
     if s.status != "active":
         raise ValueError("Session is complete")
@@ -2464,7 +2509,7 @@ def _session_candidates_for_ids(
     *,
     candidate_ids: list[uuid.UUID],
 ) -> list[TonightSessionCandidate]:
-    ordered = sorted(s.candidates, key=lambda c: c.position)
+    ordered = list(s.candidates)
     if not candidate_ids:
         return ordered
     allowed = {item_id for item_id in candidate_ids}
@@ -2607,23 +2652,21 @@ async def _upsert_legacy_vote_row(
     vote: str,
     now: datetime,
 ) -> None:
-    q = select(TonightVote).where(TonightVote.session_id == session_id, TonightVote.user_id == user_id)
-    existing = (await db.execute(q)).scalar_one_or_none()
-    if existing:
-        existing.watchlist_item_id = watchlist_item_id
-        existing.vote = vote
-        existing.updated_at = now
-        return
-
-    db.add(
-        TonightVote(
+    stmt = (
+        pg_insert(TonightVote)
+        .values(
             session_id=session_id,
             user_id=user_id,
             watchlist_item_id=watchlist_item_id,
             vote=vote,
             updated_at=now,
         )
+        .on_conflict_do_update(
+            index_elements=[TonightVote.session_id, TonightVote.user_id],
+            set_={"watchlist_item_id": watchlist_item_id, "vote": vote, "updated_at": now},
+        )
     )
+    await db.execute(stmt)
 
 
 async def cast_vote(
@@ -2637,8 +2680,7 @@ async def cast_vote(
     if vote not in {"yes", "no"}:
         raise ValueError("vote must be yes or no")
 
-    s = await _load_session_with_candidates(db, session_id)
-    await assert_user_in_group(db, s.group_id, user_id)
+    s = await _load_session_if_member(db, session_id, user_id, with_titles=False)
     await _assert_session_active(s)
 
     now = datetime.now(timezone.utc)
@@ -2696,8 +2738,7 @@ async def undo_vote(
     user_id: uuid.UUID,
     watchlist_item_id: uuid.UUID,
 ) -> None:
-    s = await _load_session_with_candidates(db, session_id)
-    await assert_user_in_group(db, s.group_id, user_id)
+    s = await _load_session_if_member(db, session_id, user_id, with_titles=False)
     await _assert_session_active(s)
 
     now = datetime.now(timezone.utc)
@@ -2731,13 +2772,15 @@ async def undo_vote(
     await db.flush()
 
 
-async def resolve_if_expired(db: AsyncSession, *, session_id: uuid.UUID) -> TonightSession:
+async def resolve_if_expired(
+    db: AsyncSession, *, session_id: uuid.UUID, now: datetime | None = None
+) -> TonightSession:
     s = await _load_session_with_candidates(db, session_id)
 
     if s.status != "active":
         return s
 
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     if s.ends_at > now:
         return s
 
@@ -2772,7 +2815,7 @@ async def _compute_winner(db: AsyncSession, s: TonightSession) -> uuid.UUID:
     if not tied_ids:
         raise ValueError("Session has no candidates")
 
-    rng = random.Random(str(s.id))
+    rng = _session_rng(s.id)
     return rng.choice(sorted(tied_ids, key=lambda x: str(x)))
 
 
@@ -2786,10 +2829,14 @@ async def _compute_winner_or_tie(
         candidate_ids = _session_base_candidate_ids(s)
     if not candidate_ids:
         return None, []
+    # A repeated id would otherwise leave zero-count slots that tie with themselves.
+    candidate_ids = list(dict.fromkeys(candidate_ids))
 
     round_state = _runtime_round_state(runtime, 1)
     round_votes = round_state["votes"]
-    stats = {item_id: {"yes": 0, "no": 0} for item_id in candidate_ids}
+    index_by_id = {item_id: idx for idx, item_id in enumerate(candidate_ids)}
+    yes = [0] * len(candidate_ids)
+    no = [0] * len(candidate_ids)
     for user_votes in round_votes.values():
         if not isinstance(user_votes, dict):
             continue
@@ -2798,22 +2845,27 @@ async def _compute_winner_or_tie(
                 item_id = uuid.UUID(str(item_id_raw))
             except (TypeError, ValueError):
                 continue
-            if item_id not in stats:
+            idx = index_by_id.get(item_id)
+            if idx is None:
                 continue
             if vote == "yes":
-                stats[item_id]["yes"] += 1
+                yes[idx] += 1
             elif vote == "no":
-                stats[item_id]["no"] += 1
-
-    if all(v["yes"] == 0 and v["no"] == 0 for v in stats.values()):
+                no[idx] += 1
+
+    # Best is most yes votes, then fewest no votes.
+    best_yes, best_no = -1, 0
+    for y, n in zip(yes, no):
+        if y > best_yes or (y == best_yes and n < best_no):
+            best_yes, best_no = y, n
+    if best_yes == 0 and not any(no):
         return None, sorted(candidate_ids, key=lambda item_id: str(item_id))
 
-    max_yes = max(v["yes"] for v in stats.values())
-    yes_tied = [item_id for item_id, v in stats.items() if v["yes"] == max_yes]
-    if len(yes_tied) == 1:
-        return yes_tied[0], []
-    min_no = min(stats[item_id]["no"] for item_id in yes_tied)
-    no_tied = [item_id for item_id in yes_tied if stats[item_id]["no"] == min_no]
+    no_tied = [
+        candidate_ids[idx]
+        for idx in range(len(candidate_ids))
+        if yes[idx] == best_yes and no[idx] == best_no
+    ]
     if len(no_tied) == 1:
         return no_tied[0], []
 
@@ -2843,8 +2895,7 @@ async def _compute_winner_or_tie(
 
 
 async def shuffle_and_complete(db: AsyncSession, *, session_id: uuid.UUID, user_id: uuid.UUID) -> SessionStateView:
-    s = await _load_session_with_candidates(db, session_id)
-    await assert_user_in_group(db, s.group_id, user_id)
+    s = await _load_session_if_member(db, session_id, user_id)
     await _assert_session_active(s)
 
     now = datetime.now(timezone.utc)
@@ -2858,7 +2909,7 @@ async def shuffle_and_complete(db: AsyncSession, *, session_id: uuid.UUID, user_
             deck_item_ids = _candidate_ids_for_round(s, runtime, 1)
         if not deck_item_ids:
             raise ValueError("Session has no candidates")
-        rng = random.Random(str(s.id) + ":shuffle:tiebreak")
+        rng = _session_rng(s.id, "shuffle:tiebreak")
     elif phase == "swiping":
         await _advance_rounds_if_needed(db, s=s, runtime=runtime, now=now)
         current_round = int(runtime.get("round") or 1)
@@ -2867,7 +2918,7 @@ async def shuffle_and_complete(db: AsyncSession, *, session_id: uuid.UUID, user_
             deck_item_ids = _candidate_ids_for_round(s, runtime, 1)
         if not deck_item_ids:
             raise ValueError("Session has no candidates")
-        rng = random.Random(str(s.id) + f":shuffle:round{current_round}")
+        rng = _session_rng(s.id, f"shuffle:round{current_round}")
     else:
         raise ValueError("Deck is not ready for auto-pick yet")
 
@@ -2891,8 +2942,7 @@ async def shuffle_and_complete(db: AsyncSession, *, session_id: uuid.UUID, user_
 
 
 async def end_session(db: AsyncSession, *, session_id: uuid.UUID, user_id: uuid.UUID) -> SessionStateView:
-    s = await _load_session_with_candidates(db, session_id)
-    await assert_user_in_group(db, s.group_id, user_id)
+    s = await _load_session_if_member(db, session_id, user_id)
     if s.group.owner_id != user_id:
         raise PermissionError("Only the group leader can end this session")
 
@@ -2917,8 +2967,7 @@ async def set_session_watch_party_url(
     user_id: uuid.UUID,
     url: str | None,
 ) -> SessionStateView:
-    s = await _load_session_with_candidates(db, session_id)
-    await assert_user_in_group(db, s.group_id, user_id)
+    s = await _load_session_if_member(db, session_id, user_id)
     if s.group.owner_id != user_id:
         raise PermissionError("Only the group leader can set the Teleparty link")
 
@@ -3143,15 +3192,14 @@ async def _build_session_state_view(
 
 
 async def get_session_state(db: AsyncSession, *, session_id: uuid.UUID, user_id: uuid.UUID) -> SessionStateView:
-    s = await _load_session_with_candidates(db, session_id)
-    await assert_user_in_group(db, s.group_id, user_id)
+    s = await _load_session_if_member(db, session_id, user_id)
 
     now = datetime.now(timezone.utc)
     if s.status == "active":
         runtime = _ensure_runtime(s)
         flow_phase = str(runtime.get("phase") or "swiping")
         if flow_phase == "swiping" and s.ends_at <= now:
-            await resolve_if_expired(db, session_id=session_id)
+            await resolve_if_expired(db, session_id=session_id, now=now)
             s = await _load_session_with_candidates(db, session_id)
 
     return await _build_session_state_view(db, s=s, user_id=user_id, now=now)
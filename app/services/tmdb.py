@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import html
+import random
 import re
 import time
+import unicodedata
 from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial
+from itertools import islice
 from typing import Any
-from urllib.parse import parse_qs, unquote, urlparse
+from urllib.parse import unquote, urlencode
 
 import httpx
 
@@ -14,7 +21,35 @@ from app.core.config import settings
 # Search results and taxonomy payloads share this bounded in-memory cache.
 _CACHE: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 _TTL_SECONDS = 600
+# Search results drift as TMDB re-ranks; per-title metadata is effectively static.
+_SEARCH_TTL_SECONDS = 300
+_TITLE_METADATA_TTL_SECONDS = 24 * 60 * 60
+# Spread expiries so entries cached together do not all miss together.
+_TTL_JITTER = 0.1
 _CACHE_MAX_ENTRIES = 512
+_CACHE_EXPIRY: list[tuple[float, str]] = []
+# Definitive misses (deleted or unknown titles) are remembered briefly so they
+# are not retried on every deck build; transient errors are not cached.
+_NEGATIVE_TTL_SECONDS = 60
+_NEGATIVE = object()
+# Concurrent cache misses for the same TMDB resource share one request.
+_INFLIGHT: dict[str, asyncio.Task[Any]] = {}
+_TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
+_TMDB_WEB_BASE_URL = "https://www.themoviedb.org"
+_TMDB_WEB_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml",
+    "User-Agent": "ArbiterTMDBWatcher/1.0",
+}
+_TMDB_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30
+)
+# A pool's connections belong to the loop that opened them, so clients are kept per loop.
+_api_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+_web_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+_wikidata_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+# Deck enrichment fans out several lookups per title; cap how many hit TMDB at once.
+_TMDB_MAX_CONCURRENT_REQUESTS = 8
+_api_semaphore: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
 TMDB_SEARCH_QUERY_MAX_LENGTH = 100
 _TMDB_SEARCH_RESULT_LIMIT = 20
 _STREAMING_BUCKETS = ("flatrate", "ads", "free")
@@ -24,8 +59,10 @@ _EXCLUDED_STREAMING_PROVIDER_NAMES = {
 }
 _WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
 _WIKIDATA_COMPANY_PROPERTY_IDS = ("P272", "P750", "P449")
+# Captures the click-through `r` target directly; hrefs may escape `&` as `&amp;`.
 _JUSTWATCH_ANCHOR_RE = re.compile(
-    r'<a href="(?P<href>https://click\.justwatch\.com/a\?[^"]+)"[^>]*title="(?P<title>[^"]+)"',
+    r'<a href="https://click\.justwatch\.com/a\?(?:[^"]*?&(?:amp;)?)?r=(?P<r>[^"&]+)[^"]*"'
+    r'[^>]*title="(?P<title>[^"]+)"',
     flags=re.IGNORECASE,
 )
 _TMDB_IMAGE_PATH_RE = re.compile(
@@ -47,15 +84,145 @@ def _cache_get(key: str):
     return value
 
 
-def _cache_set(key: str, value):
+def _cache_set(key: str, value, *, ttl: float = _TTL_SECONDS):
     now = time.time()
-    for cached_key, (expires_at, _) in list(_CACHE.items()):
-        if expires_at <= now:
-            _CACHE.pop(cached_key, None)
-    _CACHE[key] = (time.time() + _TTL_SECONDS, value)
+    # Drain expired entries in expiry order instead of sweeping the whole cache.
+    while _CACHE_EXPIRY and _CACHE_EXPIRY[0][0] <= now:
+        expires_at, expired_key = heapq.heappop(_CACHE_EXPIRY)
+        hit = _CACHE.get(expired_key)
+        if hit is not None and hit[0] == expires_at:
+            _CACHE.pop(expired_key, None)
+    expires_at = now + ttl * random.uniform(1 - _TTL_JITTER, 1 + _TTL_JITTER)
+    _CACHE[key] = (expires_at, value)
     _CACHE.move_to_end(key)
+    heapq.heappush(_CACHE_EXPIRY, (expires_at, key))
     while len(_CACHE) > _CACHE_MAX_ENTRIES:
         _CACHE.popitem(last=False)
+    if len(_CACHE_EXPIRY) > 2 * _CACHE_MAX_ENTRIES:
+        # Overwritten and LRU-evicted keys leave stale heap rows behind.
+        _CACHE_EXPIRY[:] = [(exp, k) for k, (exp, _) in _CACHE.items()]
+        heapq.heapify(_CACHE_EXPIRY)
+
+
+def _is_definitive_miss(exc: Exception) -> bool:
+    # 408 and 429 are client-class statuses that still clear up on retry.
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    status = exc.response.status_code
+    return 400 <= status < 500 and status not in {408, 429}
+
+
+def _tmdb_api_headers() -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {settings.tmdb_token}",
+        "Accept": "application/json",
+    }
+
+
+def _client_for_loop(
+    current: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None,
+    factory: Callable[[], httpx.AsyncClient],
+) -> tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    loop = asyncio.get_running_loop()
+    if current is None or current[0] is not loop or current[1].is_closed:
+        return loop, factory()
+    return current
+
+
+def _get_api_client() -> httpx.AsyncClient:
+    global _api_client
+    _api_client = _client_for_loop(
+        _api_client,
+        lambda: httpx.AsyncClient(
+            base_url=_TMDB_API_BASE_URL,
+            headers=_tmdb_api_headers(),
+            timeout=httpx.Timeout(6.0, connect=2.0),
+            limits=_TMDB_POOL_LIMITS,
+        ),
+    )
+    return _api_client[1]
+
+
+def _get_web_client() -> httpx.AsyncClient:
+    global _web_client
+    _web_client = _client_for_loop(
+        _web_client,
+        lambda: httpx.AsyncClient(
+            base_url=_TMDB_WEB_BASE_URL,
+            headers=_TMDB_WEB_HEADERS,
+            timeout=httpx.Timeout(8.0, connect=2.0),
+            limits=_TMDB_POOL_LIMITS,
+            follow_redirects=True,
+        ),
+    )
+    return _web_client[1]
+
+
+def _get_wikidata_client() -> httpx.AsyncClient:
+    global _wikidata_client
+    _wikidata_client = _client_for_loop(
+        _wikidata_client,
+        lambda: httpx.AsyncClient(timeout=6, limits=_TMDB_POOL_LIMITS),
+    )
+    return _wikidata_client[1]
+
+
+async def close_tmdb_clients() -> None:
+    global _api_client, _web_client, _wikidata_client
+    loop = asyncio.get_running_loop()
+    for entry in (_api_client, _web_client, _wikidata_client):
+        # A client from another loop cannot be closed from this one; dropping it is all that is left.
+        if entry is not None and entry[0] is loop:
+            await entry[1].aclose()
+    _api_client = None
+    _web_client = None
+    _wikidata_client = None
+
+
+def _get_api_semaphore() -> asyncio.Semaphore:
+    global _api_semaphore
+    loop = asyncio.get_running_loop()
+    if _api_semaphore is None or _api_semaphore[0] is not loop:
+        _api_semaphore = (loop, asyncio.Semaphore(_TMDB_MAX_CONCURRENT_REQUESTS))
+    return _api_semaphore[1]
+
+
+async def _tmdb_api_request(
+    path: str, *, params: dict[str, str] | None, timeout: float
+) -> Any:
+    async with _get_api_semaphore():
+        r = await _get_api_client().get(
+            path, params=params, timeout=httpx.Timeout(timeout, connect=2.0)
+        )
+    r.raise_for_status()
+    return r.json()
+
+
+def _forget_inflight(key: str, task: asyncio.Task[Any]) -> None:
+    if _INFLIGHT.get(key) is task:
+        _INFLIGHT.pop(key, None)
+    if not task.cancelled():
+        # Mark the error retrieved even if every waiter went away.
+        task.exception()
+
+
+async def _coalesced(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = task
+        task.add_done_callback(partial(_forget_inflight, key))
+    # Shield so one cancelled caller does not cancel the shared request.
+    return await asyncio.shield(task)
+
+
+async def _tmdb_api_get_json(
+    path: str, *, params: dict[str, str] | None = None, timeout: float = 6
+) -> Any:
+    key = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+    return await _coalesced(
+        key, partial(_tmdb_api_request, path, params=params, timeout=timeout)
+    )
 
 
 async def fetch_tmdb_image(
@@ -101,6 +268,45 @@ async def fetch_tmdb_image(
     return bytes(content), content_type
 
 
+# media_type -> (title field, fallback title field, date field) on search rows.
+_SEARCH_ROW_FIELDS = {
+    "movie": ("title", "original_title", "release_date"),
+    "tv": ("name", "original_name", "first_air_date"),
+}
+
+
+def _project_search_row(item: Any) -> dict[str, Any] | None:
+    if not isinstance(item, dict):
+        return None
+    media_type = item.get("media_type")
+    fields = _SEARCH_ROW_FIELDS.get(media_type)
+    if fields is None:
+        return None
+    title_field, fallback_field, date_field = fields
+    title = item.get(title_field) or item.get(fallback_field) or ""
+    tmdb_id = item.get("id")
+    if not title or not tmdb_id:
+        return None
+
+    date = item.get(date_field) or ""
+    year = None
+    if isinstance(date, str) and len(date) >= 4 and date[:4].isdigit():
+        year = int(date[:4])
+    raw_genre_ids = item.get("genre_ids")
+    return {
+        "tmdb_id": tmdb_id,
+        "media_type": media_type,
+        "title": title,
+        "year": year,
+        "poster_path": item.get("poster_path"),
+        "genre_ids": (
+            [int(v) for v in raw_genre_ids if isinstance(v, int)]
+            if isinstance(raw_genre_ids, list)
+            else []
+        ),
+    }
+
+
 async def tmdb_search_multi(q: str) -> list[dict[str, Any]]:
     q = q.strip()
     if not q:
@@ -108,64 +314,18 @@ async def tmdb_search_multi(q: str) -> list[dict[str, Any]]:
     if len(q) > TMDB_SEARCH_QUERY_MAX_LENGTH:
         raise ValueError("TMDB search query is too long")
 
-    key = f"multi:{q.lower()}"
+    # Fold case, width variants and repeated spaces so equivalent queries share
+    # a cache entry; TMDB still receives the literal query.
+    key = f"multi:{_normalize_term(unicodedata.normalize('NFKC', q).casefold())}"
     cached = _cache_get(key)
     if cached is not None:
         return cached
 
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
-
-    async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=10) as client:
-        r = await client.get("/search/multi", params={"query": q}, headers=headers)
-        r.raise_for_status()
-        data = r.json()
-
-    out: list[dict[str, Any]] = []
-    for item in data.get("results", []):
-        media_type = item.get("media_type")
-        if media_type not in ("movie", "tv"):
-            continue
-
-        tmdb_id = item.get("id")
-        poster_path = item.get("poster_path")
-        raw_genre_ids = item.get("genre_ids")
-        genre_ids = [
-            int(v)
-            for v in (raw_genre_ids if isinstance(raw_genre_ids, list) else [])
-            if isinstance(v, int)
-        ]
-
-        if media_type == "movie":
-            title = item.get("title") or item.get("original_title") or ""
-            date = item.get("release_date") or ""
-        else:
-            title = item.get("name") or item.get("original_name") or ""
-            date = item.get("first_air_date") or ""
-
-        year = None
-        if isinstance(date, str) and len(date) >= 4 and date[:4].isdigit():
-            year = int(date[:4])
-
-        if not title or not tmdb_id:
-            continue
+    data = await _tmdb_api_get_json("/search/multi", params={"query": q}, timeout=10)
 
-        out.append(
-            {
-                "tmdb_id": tmdb_id,
-                "media_type": media_type,
-                "title": title,
-                "year": year,
-                "poster_path": poster_path,
-                "genre_ids": genre_ids,
-            }
-        )
-        if len(out) >= _TMDB_SEARCH_RESULT_LIMIT:
-            break
-
-    _cache_set(key, out)
+    rows = (_project_search_row(item) for item in data.get("results", ()))
+    out = list(islice((row for row in rows if row is not None), _TMDB_SEARCH_RESULT_LIMIT))
+    _cache_set(key, out, ttl=_SEARCH_TTL_SECONDS)
     return out
 
 
@@ -173,92 +333,91 @@ def _normalize_term(value: str) -> str:
     return " ".join((value or "").strip().lower().split())
 
 
-async def fetch_tmdb_title_taxonomy(
-    *,
-    tmdb_id: int,
-    media_type: str,
-) -> tuple[set[str], set[str], set[int]]:
+async def _fetch_tmdb_taxonomy_payload(*, tmdb_id: int, media_type: str) -> dict[str, list] | None:
+    # None means the lookup could not be made or failed, as opposed to an empty taxonomy.
     if media_type not in {"movie", "tv"}:
-        return set(), set(), set()
+        return None
     if settings.env == "test":
-        return set(), set(), set()
+        return None
 
     key = f"taxonomy:{media_type}:{tmdb_id}"
     cached = _cache_get(key)
-    if cached is not None:
-        genres = {
-            _normalize_term(v)
-            for v in cached.get("genres", [])
-            if isinstance(v, str) and v.strip()
-        }
-        keywords = {
-            _normalize_term(v)
-            for v in cached.get("keywords", [])
-            if isinstance(v, str) and v.strip()
-        }
-        genre_ids = {
-            int(v)
-            for v in cached.get("genre_ids", [])
-            if isinstance(v, int) or (isinstance(v, str) and v.isdigit())
-        }
-        return genres, keywords, genre_ids
-
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
+    if cached is _NEGATIVE:
+        return None
+    if isinstance(cached, dict):
+        # Cached terms were normalized before they were stored.
+        return cached
 
     path = f"/{media_type}/{tmdb_id}"
     params = {"append_to_response": "keywords"}
 
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            r = await client.get(path, params=params, headers=headers)
-            r.raise_for_status()
-            data = r.json()
-    except (httpx.HTTPError, ValueError):
-        return set(), set(), set()
+        data = await _tmdb_api_get_json(path, params=params)
+    except (httpx.HTTPError, ValueError) as exc:
+        if _is_definitive_miss(exc):
+            _cache_set(key, _NEGATIVE, ttl=_NEGATIVE_TTL_SECONDS)
+        return None
 
-    genre_rows = [g for g in data.get("genres", []) if isinstance(g, dict)]
-    genre_names = [g.get("name") for g in genre_rows]
-    genre_ids = {
-        int(g["id"])
-        for g in genre_rows
-        if isinstance(g.get("id"), int)
-    }
+    genres: set[str] = set()
+    genre_ids: set[int] = set()
+    for row in data.get("genres", ()):
+        if not isinstance(row, dict):
+            continue
+        name = row.get("name")
+        if isinstance(name, str) and name.strip():
+            genres.add(_normalize_term(name))
+        genre_id = row.get("id")
+        if isinstance(genre_id, int):
+            genre_ids.add(genre_id)
 
     keywords_node = data.get("keywords", {})
-    keyword_rows: list[dict[str, Any]] = []
+    keyword_rows: Any = ()
     if isinstance(keywords_node, dict):
         maybe_keywords = keywords_node.get("keywords")
         maybe_results = keywords_node.get("results")
         if isinstance(maybe_keywords, list):
-            keyword_rows = [k for k in maybe_keywords if isinstance(k, dict)]
+            keyword_rows = maybe_keywords
         elif isinstance(maybe_results, list):
-            keyword_rows = [k for k in maybe_results if isinstance(k, dict)]
+            keyword_rows = maybe_results
 
-    keyword_names = [k.get("name") for k in keyword_rows]
+    keywords: set[str] = set()
+    for row in keyword_rows:
+        if not isinstance(row, dict):
+            continue
+        name = row.get("name")
+        if isinstance(name, str) and name.strip():
+            keywords.add(_normalize_term(name))
 
-    genres = {
-        _normalize_term(v)
-        for v in genre_names
-        if isinstance(v, str) and v.strip()
-    }
-    keywords = {
-        _normalize_term(v)
-        for v in keyword_names
-        if isinstance(v, str) and v.strip()
+    payload = {
+        "genres": sorted(genres),
+        "keywords": sorted(keywords),
+        "genre_ids": sorted(genre_ids),
     }
+    _cache_set(key, payload, ttl=_TITLE_METADATA_TTL_SECONDS)
+    return payload
+
 
-    _cache_set(
-        key,
-        {
-            "genres": sorted(genres),
-            "keywords": sorted(keywords),
-            "genre_ids": sorted(genre_ids),
-        },
+async def fetch_tmdb_title_taxonomy(
+    *,
+    tmdb_id: int,
+    media_type: str,
+) -> tuple[set[str], set[str], set[int]]:
+    payload = await _fetch_tmdb_taxonomy_payload(tmdb_id=tmdb_id, media_type=media_type)
+    if payload is None:
+        return set(), set(), set()
+    return (
+        set(payload.get("genres", ())),
+        set(payload.get("keywords", ())),
+        set(payload.get("genre_ids", ())),
     )
-    return genres, keywords, genre_ids
+
+
+async def fetch_tmdb_title_genre_ids(*, tmdb_id: int, media_type: str) -> list[int] | None:
+    """Sorted TMDB genre ids: [] when TMDB lists none, None when the lookup failed."""
+    payload = await _fetch_tmdb_taxonomy_payload(tmdb_id=tmdb_id, media_type=media_type)
+    if payload is None:
+        return None
+    return sorted(payload.get("genre_ids", ()))
 
 
 async def fetch_tmdb_title_people_names(
@@ -282,10 +441,6 @@ async def fetch_tmdb_title_people_names(
                 if isinstance(value, str) and value.strip()
             }
 
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
     credits_path = (
         f"/movie/{tmdb_id}/credits"
         if media_type == "movie"
@@ -293,10 +448,7 @@ async def fetch_tmdb_title_people_names(
     )
 
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            r = await client.get(credits_path, headers=headers)
-            r.raise_for_status()
-            data = r.json()
+        data = await _tmdb_api_get_json(credits_path)
     except (httpx.HTTPError, ValueError):
         return set()
 
@@ -364,7 +516,7 @@ async def fetch_tmdb_title_people_names(
         for name in names
         if isinstance(name, str) and name.strip()
     }
-    _cache_set(key, {"names": sorted(normalized)})
+    _cache_set(key, {"names": sorted(normalized)}, ttl=_TITLE_METADATA_TTL_SECONDS)
     return normalized
 
 
@@ -389,17 +541,10 @@ async def fetch_tmdb_title_locale_tokens(
                 if isinstance(value, str) and value.strip()
             }
 
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
     path = f"/{media_type}/{tmdb_id}"
 
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            r = await client.get(path, headers=headers)
-            r.raise_for_status()
-            data = r.json()
+        data = await _tmdb_api_get_json(path)
     except (httpx.HTTPError, ValueError):
         return set()
 
@@ -435,7 +580,7 @@ async def fetch_tmdb_title_locale_tokens(
                 if isinstance(raw_value, str) and raw_value.strip():
                     tokens.add(_normalize_term(raw_value))
 
-    _cache_set(key, {"tokens": sorted(tokens)})
+    _cache_set(key, {"tokens": sorted(tokens)}, ttl=_TITLE_METADATA_TTL_SECONDS)
     return tokens
 
 
@@ -460,17 +605,10 @@ async def fetch_tmdb_title_company_names(
                 if isinstance(value, str) and value.strip()
             }
 
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
     path = f"/{media_type}/{tmdb_id}"
 
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            r = await client.get(path, headers=headers)
-            r.raise_for_status()
-            data = r.json()
+        data = await _tmdb_api_get_json(path)
     except (httpx.HTTPError, ValueError):
         return set()
 
@@ -493,7 +631,7 @@ async def fetch_tmdb_title_company_names(
             if isinstance(raw_name, str) and raw_name.strip():
                 names.add(_normalize_term(raw_name))
 
-    _cache_set(key, {"names": sorted(names)})
+    _cache_set(key, {"names": sorted(names)}, ttl=_TITLE_METADATA_TTL_SECONDS)
     return names
 
 
@@ -586,6 +724,7 @@ async def fetch_web_title_company_names(
                 if isinstance(value, str) and value.strip()
             }
 
+    client = _get_wikidata_client()
     search_params = {
         "action": "wbsearchentities",
         "search": title,
@@ -595,10 +734,9 @@ async def fetch_web_title_company_names(
         "limit": 8,
     }
     try:
-        async with httpx.AsyncClient(timeout=6) as client:
-            search_response = await client.get(_WIKIDATA_API_URL, params=search_params)
-            search_response.raise_for_status()
-            search_payload = search_response.json()
+        search_response = await client.get(_WIKIDATA_API_URL, params=search_params)
+        search_response.raise_for_status()
+        search_payload = search_response.json()
     except (httpx.HTTPError, ValueError):
         return set()
 
@@ -622,10 +760,9 @@ async def fetch_web_title_company_names(
         "format": "json",
     }
     try:
-        async with httpx.AsyncClient(timeout=6) as client:
-            detail_response = await client.get(_WIKIDATA_API_URL, params=detail_params)
-            detail_response.raise_for_status()
-            detail_payload = detail_response.json()
+        detail_response = await client.get(_WIKIDATA_API_URL, params=detail_params)
+        detail_response.raise_for_status()
+        detail_payload = detail_response.json()
     except (httpx.HTTPError, ValueError):
         return set()
 
@@ -660,10 +797,9 @@ async def fetch_web_title_company_names(
         "format": "json",
     }
     try:
-        async with httpx.AsyncClient(timeout=6) as client:
-            label_response = await client.get(_WIKIDATA_API_URL, params=label_params)
-            label_response.raise_for_status()
-            label_payload = label_response.json()
+        label_response = await client.get(_WIKIDATA_API_URL, params=label_params)
+        label_response.raise_for_status()
+        label_payload = label_response.json()
     except (httpx.HTTPError, ValueError):
         return set()
 
@@ -686,7 +822,7 @@ async def fetch_web_title_company_names(
         if isinstance(raw_name, str) and raw_name.strip():
             names.add(_normalize_term(raw_name))
 
-    _cache_set(key, {"names": sorted(names)})
+    _cache_set(key, {"names": sorted(names)}, ttl=_TITLE_METADATA_TTL_SECONDS)
     return names
 
 
@@ -713,21 +849,17 @@ async def fetch_tmdb_title_details(*, tmdb_id: int, media_type: str) -> dict[str
 
     key = f"details:{media_type}:{tmdb_id}"
     cached = _cache_get(key)
+    if cached is _NEGATIVE:
+        return {}
     if isinstance(cached, dict):
         return dict(cached)
 
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
-
     path = f"/{media_type}/{tmdb_id}"
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            r = await client.get(path, headers=headers)
-            r.raise_for_status()
-            data = r.json()
-    except (httpx.HTTPError, ValueError):
+        data = await _tmdb_api_get_json(path)
+    except (httpx.HTTPError, ValueError) as exc:
+        if _is_definitive_miss(exc):
+            _cache_set(key, _NEGATIVE, ttl=_NEGATIVE_TTL_SECONDS)
         return {}
 
     runtime_minutes = _runtime_from_tmdb_payload(media_type=media_type, data=data)
@@ -736,7 +868,7 @@ async def fetch_tmdb_title_details(*, tmdb_id: int, media_type: str) -> dict[str
         "runtime_minutes": runtime_minutes,
         "overview": overview if isinstance(overview, str) and overview.strip() else None,
     }
-    _cache_set(key, details)
+    _cache_set(key, details, ttl=_TITLE_METADATA_TTL_SECONDS)
     return details
 
 
@@ -838,19 +970,10 @@ async def fetch_tmdb_presentation_details(*, tmdb_id: int, media_type: str) -> d
         return {}
 
     append = "credits,videos,release_dates" if media_type == "movie" else "aggregate_credits,videos,content_ratings"
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            response = await client.get(
-                f"/{media_type}/{tmdb_id}",
-                params={"append_to_response": append},
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = await _tmdb_api_get_json(
+            f"/{media_type}/{tmdb_id}", params={"append_to_response": append}
+        )
     except (httpx.HTTPError, ValueError):
         return {}
 
@@ -876,7 +999,7 @@ async def fetch_tmdb_presentation_details(*, tmdb_id: int, media_type: str) -> d
         "certification": _presentation_certification(data, media_type),
         "trailer_url": _presentation_trailer(data),
     }
-    _cache_set(key, details)
+    _cache_set(key, details, ttl=_TITLE_METADATA_TTL_SECONDS)
     return details
 
 
@@ -929,7 +1052,7 @@ def _dedupe_streaming_providers(region_payload: dict[str, Any]) -> list[dict[str
 
 
 def _extract_direct_streaming_urls_from_watch_html(markup: str) -> dict[str, str]:
-    if not isinstance(markup, str) or not markup.strip():
+    if not isinstance(markup, str) or "click.justwatch.com" not in markup.lower():
         return {}
 
     out: dict[str, str] = {}
@@ -942,31 +1065,29 @@ def _extract_direct_streaming_urls_from_watch_html(markup: str) -> dict[str, str
         split_at = title_lower.rfind(" on ")
         if split_at < 0:
             continue
-        provider_name = title_attr[split_at + 4 :].strip()
-        if not provider_name:
+        key = title_lower[split_at + 4 :].strip()
+        if not key or key in out:
             continue
 
-        href = html.unescape(match.group("href") or "").strip()
-        if not href:
-            continue
-
-        parsed_href = urlparse(href)
-        query = parse_qs(parsed_href.query)
-        raw_target = query.get("r", [None])[0]
-        if not isinstance(raw_target, str) or not raw_target.strip():
+        raw_target = unquote(html.unescape(match.group("r")).replace("+", " "))
+        if not raw_target.strip():
             continue
 
         target = unquote(raw_target).strip()
         if not target.startswith(("http://", "https://")):
             continue
 
-        key = provider_name.lower()
-        if key not in out:
-            out[key] = target
+        out[key] = target
 
     return out
 
 
+async def _tmdb_web_get_text(path: str, *, params: dict[str, str]) -> str:
+    r = await _get_web_client().get(path, params=params)
+    r.raise_for_status()
+    return r.text
+
+
 async def _fetch_tmdb_watch_page_streaming_links(
     *,
     tmdb_id: int,
@@ -976,20 +1097,12 @@ async def _fetch_tmdb_watch_page_streaming_links(
     normalized_region = (region or _DEFAULT_PROVIDER_REGION).strip().upper() or _DEFAULT_PROVIDER_REGION
     path = f"/{media_type}/{tmdb_id}/watch"
     params = {"locale": normalized_region}
-    headers = {
-        "Accept": "text/html,application/xhtml+xml",
-        "User-Agent": "ArbiterTMDBWatcher/1.0",
-    }
 
     try:
-        async with httpx.AsyncClient(
-            base_url="https://www.themoviedb.org",
-            timeout=8,
-            follow_redirects=True,
-        ) as client:
-            r = await client.get(path, params=params, headers=headers)
-            r.raise_for_status()
-            markup = r.text
+        markup = await _coalesced(
+            f"web:{path}?locale={normalized_region}",
+            partial(_tmdb_web_get_text, path, params=params),
+        )
     except httpx.HTTPError:
         return {}
 
@@ -1010,6 +1123,8 @@ async def fetch_tmdb_watch_providers(
     normalized_region = (region or _DEFAULT_PROVIDER_REGION).strip().upper() or _DEFAULT_PROVIDER_REGION
     key = f"providers:{media_type}:{tmdb_id}:{normalized_region}"
     cached = _cache_get(key)
+    if cached is _NEGATIVE:
+        return {"region": normalized_region, "link": None, "streaming_providers": []}
     if isinstance(cached, dict):
         providers = cached.get("streaming_providers")
         if isinstance(providers, list):
@@ -1019,18 +1134,13 @@ async def fetch_tmdb_watch_providers(
                 "streaming_providers": [dict(row) for row in providers if isinstance(row, dict)],
             }
 
-    headers = {
-        "Authorization": f"Bearer {settings.tmdb_token}",
-        "Accept": "application/json",
-    }
     path = f"/{media_type}/{tmdb_id}/watch/providers"
 
     try:
-        async with httpx.AsyncClient(base_url="https://api.themoviedb.org/3", timeout=6) as client:
-            r = await client.get(path, headers=headers)
-            r.raise_for_status()
-            data = r.json()
-    except (httpx.HTTPError, ValueError):
+        data = await _tmdb_api_get_json(path)
+    except (httpx.HTTPError, ValueError) as exc:
+        if _is_definitive_miss(exc):
+            _cache_set(key, _NEGATIVE, ttl=_NEGATIVE_TTL_SECONDS)
         return {"region": normalized_region, "link": None, "streaming_providers": []}
 
     results = data.get("results")
@@ -1040,21 +1150,23 @@ async def fetch_tmdb_watch_providers(
 
     link = region_payload.get("link") if isinstance(region_payload.get("link"), str) else None
     providers = _dedupe_streaming_providers(region_payload)
-    deep_links_by_provider = (
-        await _fetch_tmdb_watch_page_streaming_links(
-            tmdb_id=tmdb_id,
-            media_type=media_type,
-            region=normalized_region,
-        )
-        if providers
-        else {}
-    )
+    deep_links_by_provider: dict[str, str] = {}
+    if providers:
+        # The watch page only supplies deep links, so it is scraped only when there is something to link.
+        try:
+            deep_links_by_provider = await _fetch_tmdb_watch_page_streaming_links(
+                tmdb_id=tmdb_id,
+                media_type=media_type,
+                region=normalized_region,
+            )
+        except (httpx.HTTPError, ValueError):
+            deep_links_by_provider = {}
     for provider in providers:
         name = provider.get("provider_name")
-        key = name.lower() if isinstance(name, str) else None
+        provider_key = name.lower() if isinstance(name, str) else None
         provider["streaming_url"] = (
-            deep_links_by_provider.get(key)
-            if isinstance(key, str) and key
+            deep_links_by_provider.get(provider_key)
+            if isinstance(provider_key, str) and provider_key
             else None
         )
 
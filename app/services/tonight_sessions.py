@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 import sqlalchemy as sa
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.models.group_membership import GroupMembership
 from app.models.tonight_session import TonightSession
@@ -27,24 +27,29 @@ async def assert_user_in_group(db: AsyncSession, group_id: uuid.UUID, user_id: u
 
 
 def _apply_hard_filters(items: list[WatchlistItem], c: TonightConstraints) -> list[WatchlistItem]:
+    fmt = c.format if c.format != "any" else None
+    max_runtime = c.max_runtime
+    avoid = [a.lower() for a in c.avoid or []]
+    if fmt is None and max_runtime is None and not avoid:
+        return list(items)
+
     out: list[WatchlistItem] = []
 
     for wi in items:
         t = wi.title
 
         # format hard filter
-        if c.format != "any" and t.media_type != c.format:
+        if fmt is not None and t.media_type != fmt:
             continue
 
         # max_runtime hard filter (only if runtime known)
-        if c.max_runtime is not None and t.runtime_minutes is not None and t.runtime_minutes > c.max_runtime:
+        if max_runtime is not None and t.runtime_minutes is not None and t.runtime_minutes > max_runtime:
             continue
 
         # "avoid" hard filter (basic v1: string contains in title/overview)
-        if c.avoid:
+        if avoid:
             hay = f"{t.name or ''} {t.overview or ''}".lower()
-            blocked = any(a.lower() in hay for a in c.avoid)
-            if blocked:
+            if any(a in hay for a in avoid):
                 continue
 
         out.append(wi)
@@ -53,11 +58,9 @@ def _apply_hard_filters(items: list[WatchlistItem], c: TonightConstraints) -> li
 
 
 def _baseline_pick(items: list[WatchlistItem], top_k: int, seed: str) -> list[WatchlistItem]:
-    # deterministic shuffle based on seed
+    # deterministic sample based on seed; only top_k draws instead of a full shuffle
     rng = random.Random(seed)
-    items2 = list(items)
-    rng.shuffle(items2)
-    return items2[:top_k]
+    return rng.sample(items, min(top_k, len(items)))
 
 
 async def create_tonight_session(
@@ -72,45 +75,47 @@ async def create_tonight_session(
 ) -> tuple[TonightSession, list[WatchlistItem], str | None]:
     await assert_user_in_group(db, group_id, user_id)
 
-    baseline = constraints.model_copy(deep=True)
+    # Only read from here on (the AI merge works on a dump), so no defensive copy.
+    baseline = constraints
 
     # AI parse (optional)
     final_constraints = baseline
     if text and text.strip():
         parsed = await ai_parse_constraints(baseline=baseline, text=text)
-        # enforce "narrow only" rules here
-        final_constraints = baseline.model_copy(deep=True)
-        final_constraints.free_text = parsed.free_text
-        final_constraints.parsed_by_ai = parsed.parsed_by_ai
-        final_constraints.ai_version = parsed.ai_version
+        # enforce "narrow only" rules here, merging into one dict so the
+        # result is validated exactly once
+        merged = baseline.model_dump()
+        merged["free_text"] = parsed.free_text
+        merged["parsed_by_ai"] = parsed.parsed_by_ai
+        merged["ai_version"] = parsed.ai_version
 
         # moods/avoid can be merged (narrowing)
-        final_constraints.moods = list({*(baseline.moods or []), *(parsed.moods or [])})
-        final_constraints.avoid = list({*(baseline.avoid or []), *(parsed.avoid or [])})
+        merged["moods"] = list({*(baseline.moods or []), *(parsed.moods or [])})
+        merged["avoid"] = list({*(baseline.avoid or []), *(parsed.avoid or [])})
 
         # energy can be filled if empty
-        if final_constraints.energy is None:
-            final_constraints.energy = parsed.energy
+        if merged["energy"] is None:
+            merged["energy"] = parsed.energy
 
         # format can be filled if UI left "any"
         if baseline.format == "any" and parsed.format:
-            final_constraints.format = parsed.format
+            merged["format"] = parsed.format
 
         # max_runtime can be set if UI left null, or lowered (never raised)
         if baseline.max_runtime is None:
-            final_constraints.max_runtime = parsed.max_runtime
+            merged["max_runtime"] = parsed.max_runtime
         else:
             if parsed.max_runtime is not None:
-                final_constraints.max_runtime = min(baseline.max_runtime, parsed.max_runtime)
+                merged["max_runtime"] = min(baseline.max_runtime, parsed.max_runtime)
 
-        # re-validate canonical rules
-        final_constraints = TonightConstraints.model_validate(final_constraints.model_dump())
+        # validate canonical rules
+        final_constraints = TonightConstraints.model_validate(merged)
 
     # Pool: watchlist + not snoozed + status=watchlist
     now = datetime.now(timezone.utc)
     q = (
         select(WatchlistItem)
-        .options(selectinload(WatchlistItem.title))
+        .options(joinedload(WatchlistItem.title))
         .where(WatchlistItem.group_id == group_id)
         .where(WatchlistItem.status == "watchlist")
         .where(sa.or_(WatchlistItem.snoozed_until.is_(None), WatchlistItem.snoozed_until <= now))
@@ -145,7 +150,8 @@ async def create_tonight_session(
     ordered: list[WatchlistItem] = [by_id[i] for i in rerank.ordered_ids if i in by_id]
     if len(ordered) < min(candidate_count, len(pre)):
         # append remaining in pre order, deterministic
-        remaining = [wi for wi in pre if str(wi.id) not in set(rerank.ordered_ids)]
+        ordered_id_set = set(rerank.ordered_ids)
+        remaining = [wi for wi in pre if str(wi.id) not in ordered_id_set]
         ordered.extend(remaining)
 
     ordered = ordered[:candidate_count]
@@ -166,13 +172,13 @@ async def create_tonight_session(
     db.add(s)
     await db.flush()
 
-    for idx, wi in enumerate(ordered):
-        db.add(
-            TonightSessionCandidate(
-                session_id=s.id,
-                watchlist_item_id=wi.id,
-                position=idx,
-            )
+    if ordered:
+        await db.execute(
+            sa.insert(TonightSessionCandidate),
+            [
+                {"session_id": s.id, "watchlist_item_id": wi.id, "position": idx}
+                for idx, wi in enumerate(ordered)
+            ],
         )
 
     return s, ordered, rerank.why
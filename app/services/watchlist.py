@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
+import json
 import uuid
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
 import sqlalchemy as sa
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased, contains_eager, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.group_membership import GroupMembership
 from app.models.title import Title
+from app.models.user import User
 from app.models.watchlist_item import WatchlistItem
-from app.services.tmdb import fetch_tmdb_title_details, fetch_tmdb_title_taxonomy
+from app.services.tmdb import fetch_tmdb_title_details, fetch_tmdb_title_genre_ids
 UNSET = object()
 
 
@@ -24,93 +30,149 @@ class WatchlistPage:
     next_cursor: str | None
     total_count: int
 
+# Set per HTTP request by MembershipCacheMiddleware; None (no memo) everywhere else.
+verified_memberships: ContextVar[set[tuple[uuid.UUID, uuid.UUID]] | None] = ContextVar(
+    "verified_memberships", default=None
+)
+
+
 async def assert_user_in_group(db: AsyncSession, group_id: uuid.UUID, user_id: uuid.UUID) -> None:
-    q = select(GroupMembership.id).where(
-        GroupMembership.group_id == group_id,
-        GroupMembership.user_id == user_id,
+    verified = verified_memberships.get()
+    if verified is not None and (group_id, user_id) in verified:
+        return
+    # lambda_stmt caches the built statement per code location; the ids become bound parameters.
+    q = sa.lambda_stmt(
+        lambda: select(GroupMembership.id).where(
+            GroupMembership.group_id == group_id,
+            GroupMembership.user_id == user_id,
+        )
     )
     if (await db.execute(q)).scalar_one_or_none() is None:
         raise PermissionError("Not a member of this group")
+    if verified is not None:
+        verified.add((group_id, user_id))
 
 
-async def upsert_tmdb_title(
-    db: AsyncSession,
+def _membership_clause(group_id: uuid.UUID, user_id: uuid.UUID):
+    """EXISTS predicate that lets a read query carry its own membership check."""
+    return sa.exists().where(
+        GroupMembership.group_id == group_id,
+        GroupMembership.user_id == user_id,
+    )
+
+
+def _guarded_insert(model, values: dict, guard):
+    """INSERT ... SELECT of literal values, so ``guard`` can veto the write inside the same statement."""
+    columns = model.__table__.c
+    source = select(*(sa.literal(value, columns[key].type) for key, value in values.items())).where(guard)
+    return pg_insert(model).from_select(list(values), source)
+
+
+def _title_and_item_insert_stmt(title_cte, *, group_id: uuid.UUID, user_id: uuid.UUID):
+    """Insert the watchlist item for the title row ``title_cte`` returns; select both back as entities."""
+    columns = WatchlistItem.__table__.c
+    item_cte = (
+        pg_insert(WatchlistItem)
+        .from_select(
+            ["id", "group_id", "title_id", "added_by_user_id"],
+            select(
+                sa.literal(uuid.uuid4(), columns.id.type),
+                sa.literal(group_id, columns.group_id.type),
+                title_cte.c.id,
+                sa.literal(user_id, columns.added_by_user_id.type),
+            ),
+        )
+        # A concurrent add of the same title is a no-op rather than an IntegrityError,
+        # so the transaction (and the title write) survives the race.
+        .on_conflict_do_nothing(constraint="uq_watchlist_items_group_title")
+        .returning(*WatchlistItem.__table__.c)
+        .cte("inserted_item")
+    )
+    return (
+        select(aliased(Title, title_cte), aliased(WatchlistItem, item_cte))
+        .select_from(title_cte)
+        .outerjoin(item_cte, sa.true())
+        .execution_options(populate_existing=True)
+    )
+
+
+def _tmdb_title_upsert_stmt(
     *,
     tmdb_id: int,
     media_type: str,
     name: str,
     year: int | None,
     poster_path: str | None,
-) -> Title:
-    source = "tmdb"
-    source_id = str(tmdb_id)
-
-    # Try fetch
-    q = select(Title).where(
-        Title.source == source,
-        Title.source_id == source_id,
-        Title.media_type == media_type,
-    )
-    existing = (await db.execute(q)).scalar_one_or_none()
-    if existing:
-        # Update only if new data is present (don’t blank out fields)
-        if name and existing.name != name:
-            existing.name = name
-        if year is not None and existing.release_year != year:
-            existing.release_year = year
-        if poster_path is not None and existing.poster_path != poster_path:
-            existing.poster_path = poster_path
-        if existing.runtime_minutes is None or not existing.overview:
-            details = await fetch_tmdb_title_details(tmdb_id=tmdb_id, media_type=media_type)
-            runtime_minutes = details.get("runtime_minutes") if isinstance(details, dict) else None
-            overview = details.get("overview") if isinstance(details, dict) else None
-            if isinstance(runtime_minutes, int) and runtime_minutes > 0 and existing.runtime_minutes != runtime_minutes:
-                existing.runtime_minutes = runtime_minutes
-            if isinstance(overview, str) and overview.strip() and not existing.overview:
-                existing.overview = overview
-        return existing
-
-    details = await fetch_tmdb_title_details(tmdb_id=tmdb_id, media_type=media_type)
-    runtime_minutes = details.get("runtime_minutes") if isinstance(details, dict) else None
-    overview = details.get("overview") if isinstance(details, dict) else None
-    t = Title(
-        source=source,
-        source_id=source_id,
-        media_type=media_type,
-        name=name,
-        release_year=year,
-        poster_path=poster_path,
-        overview=overview if isinstance(overview, str) and overview.strip() else None,
-        runtime_minutes=runtime_minutes if isinstance(runtime_minutes, int) and runtime_minutes > 0 else None,
+    guard=None,
+):
+    values = {
+        "id": uuid.uuid4(),
+        "source": "tmdb",
+        "source_id": str(tmdb_id),
+        "media_type": media_type,
+        "name": name,
+        "release_year": year,
+        "poster_path": poster_path,
+    }
+    insert_stmt = pg_insert(Title).values(**values) if guard is None else _guarded_insert(Title, values, guard)
+    # Insert or refresh in one statement; only overwrite with data the caller has
+    # (don’t blank out fields).
+    return insert_stmt.on_conflict_do_update(
+        constraint="uq_titles_source_source_id_media_type",
+        set_={
+            "name": sa.func.coalesce(sa.func.nullif(insert_stmt.excluded.name, ""), Title.name),
+            "release_year": sa.func.coalesce(insert_stmt.excluded.release_year, Title.release_year),
+            "poster_path": sa.func.coalesce(insert_stmt.excluded.poster_path, Title.poster_path),
+        },
     )
-    db.add(t)
-    await db.flush()  # get id
-    return t
 
 
-async def create_manual_title(
+async def upsert_tmdb_title(
     db: AsyncSession,
     *,
-    name: str,
+    tmdb_id: int,
     media_type: str,
+    name: str,
     year: int | None,
     poster_path: str | None,
-    overview: str | None,
 ) -> Title:
-    t = Title(
-        source="manual",
-        source_id=None,
-        media_type=media_type,
-        name=name,
-        release_year=year,
-        poster_path=poster_path,
-        overview=overview,
+    upsert_stmt = (
+        _tmdb_title_upsert_stmt(
+            tmdb_id=tmdb_id,
+            media_type=media_type,
+            name=name,
+            year=year,
+            poster_path=poster_path,
+        )
+        .returning(Title)
+        .execution_options(populate_existing=True)
     )
-    db.add(t)
-    await db.flush()
+    t = (await db.execute(upsert_stmt)).scalar_one()
+    await _fill_missing_tmdb_metadata(t, tmdb_id=tmdb_id, media_type=media_type)
     return t
 
 
+async def _fill_missing_tmdb_metadata(t: Title, *, tmdb_id: int, media_type: str) -> None:
+    lookups = {}
+    if t.runtime_minutes is None or not t.overview:
+        lookups["details"] = fetch_tmdb_title_details(tmdb_id=tmdb_id, media_type=media_type)
+    if t.tmdb_genre_ids is None:
+        lookups["genre_ids"] = fetch_tmdb_title_genre_ids(tmdb_id=tmdb_id, media_type=media_type)
+    if not lookups:
+        return
+    found = dict(zip(lookups, await asyncio.gather(*lookups.values())))
+
+    details = found.get("details")
+    runtime_minutes = details.get("runtime_minutes") if isinstance(details, dict) else None
+    overview = details.get("overview") if isinstance(details, dict) else None
+    if isinstance(runtime_minutes, int) and runtime_minutes > 0 and t.runtime_minutes != runtime_minutes:
+        t.runtime_minutes = runtime_minutes
+    if isinstance(overview, str) and overview.strip() and not t.overview:
+        t.overview = overview
+    if found.get("genre_ids") is not None:
+        t.tmdb_genre_ids = found["genre_ids"]
+
+
 async def add_watchlist_item_tmdb(
     db: AsyncSession,
     *,
@@ -122,49 +184,51 @@ async def add_watchlist_item_tmdb(
     year: int | None,
     poster_path: str | None,
 ) -> tuple[WatchlistItem, bool]:
-    await assert_user_in_group(db, group_id, user_id)
-
-    t = await upsert_tmdb_title(
-        db,
-        tmdb_id=tmdb_id,
-        media_type=media_type,
-        name=title,
-        year=year,
-        poster_path=poster_path,
-    )
-
-    item = WatchlistItem(group_id=group_id, title_id=t.id)
-    item.added_by_user_id = user_id
-    db.add(item)
-
-    try:
-        await db.flush()
-        already_exists = False
-    except IntegrityError:
-        await db.rollback()
-
-        # Re-fetch title in a clean transaction state
-        q_title = select(Title).where(
-            Title.source == "tmdb",
-            Title.source_id == str(tmdb_id),
-            Title.media_type == media_type,
+    # Membership check, title upsert and item insert run as one statement: the
+    # title CTE only writes when the membership EXISTS guard passes, and the item
+    # CTE inserts from whatever title row it returned.
+    title_cte = (
+        _tmdb_title_upsert_stmt(
+            tmdb_id=tmdb_id,
+            media_type=media_type,
+            name=title,
+            year=year,
+            poster_path=poster_path,
+            guard=_membership_clause(group_id, user_id),
         )
-        t2 = (await db.execute(q_title)).scalar_one()
+        .returning(*Title.__table__.c)
+        .cte("upserted_title")
+    )
+    stmt = _title_and_item_insert_stmt(title_cte, group_id=group_id, user_id=user_id)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        raise PermissionError("Not a member of this group")
+    t, item = row
+    await _fill_missing_tmdb_metadata(t, tmdb_id=tmdb_id, media_type=media_type)
 
+    if item is None:
         q_item = (
             select(WatchlistItem)
             .options(
                 selectinload(WatchlistItem.title),
                 selectinload(WatchlistItem.added_by_user),
             )
-            .where(WatchlistItem.group_id == group_id, WatchlistItem.title_id == t2.id)
+            .where(WatchlistItem.group_id == group_id, WatchlistItem.title_id == t.id)
         )
         existing = (await db.execute(q_item)).scalar_one()
         return existing, True
 
-    await db.refresh(item, attribute_names=["title", "added_by_user"])
-    already_exists = False
-    return item, already_exists
+    await _attach_loaded_relationships(db, item, title=t, user_id=user_id)
+    return item, False
+
+
+async def _attach_loaded_relationships(
+    db: AsyncSession, item: WatchlistItem, *, title: Title, user_id: uuid.UUID
+) -> None:
+    # The title was just written and the adder is usually already in the identity
+    # map (auth loaded them), so fill both in without a refresh round-trip.
+    set_committed_value(item, "title", title)
+    set_committed_value(item, "added_by_user", await db.get(User, user_id))
 
 
 async def add_watchlist_item_manual(
@@ -178,21 +242,31 @@ async def add_watchlist_item_manual(
     poster_path: str | None,
     overview: str | None,
 ) -> WatchlistItem:
-    await assert_user_in_group(db, group_id, user_id)
-
-    t = await create_manual_title(
-        db,
-        name=title,
-        media_type=media_type,
-        year=year,
-        poster_path=poster_path,
-        overview=overview,
+    # Same single statement as the TMDB path; a brand-new title cannot conflict.
+    title_cte = (
+        _guarded_insert(
+            Title,
+            {
+                "id": uuid.uuid4(),
+                "source": "manual",
+                "source_id": None,
+                "media_type": media_type,
+                "name": title,
+                "release_year": year,
+                "poster_path": poster_path,
+                "overview": overview,
+            },
+            _membership_clause(group_id, user_id),
+        )
+        .returning(*Title.__table__.c)
+        .cte("inserted_title")
     )
-    item = WatchlistItem(group_id=group_id, title_id=t.id)
-    item.added_by_user_id = user_id
-    db.add(item)
-    await db.flush()
-    await db.refresh(item, attribute_names=["title", "added_by_user"])
+    stmt = _title_and_item_insert_stmt(title_cte, group_id=group_id, user_id=user_id)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        raise PermissionError("Not a member of this group")
+    t, item = row
+    await _attach_loaded_relationships(db, item, title=t, user_id=user_id)
     return item
 
 
@@ -207,8 +281,6 @@ async def list_watchlist(
     media_type: str | None = None,
     sort: str = "recent",
 ) -> list[WatchlistItem]:
-    await assert_user_in_group(db, group_id, user_id)
-
     stmt = _build_watchlist_stmt(
         group_id=group_id,
         status=status,
@@ -218,18 +290,68 @@ async def list_watchlist(
         sort=sort,
         include_options=True,
         include_sort=True,
-    )
-    return (await db.execute(stmt)).scalars().all()
+    ).where(_membership_clause(group_id, user_id))
+    items = (await db.execute(stmt)).scalars().all()
+    if not items:
+        # An empty result is either an empty watchlist or a non-member; only then ask which.
+        await assert_user_in_group(db, group_id, user_id)
+    return items
+
+
+# Keeps a client-supplied offset within Postgres' integer range.
+_MAX_CURSOR_SEEN = 2**31 - 1
+
+
+@dataclass(frozen=True)
+class _WatchlistCursor:
+    # Sort key of the last row served: its created_at (ISO) or, for alpha, its title name.
+    key: str
+    item_id: uuid.UUID
+
+
+def _encode_cursor(*, seen: int, item: WatchlistItem, sort: str) -> str:
+    key = item.title.name if sort == "alpha" else item.created_at.isoformat()
+    raw = json.dumps({"s": sort, "n": seen, "k": key, "id": str(item.id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
 
 
-def _decode_cursor(cursor: str | None) -> int:
-    if not cursor:
-        return 0
+def _decode_cursor(cursor: str | None, *, sort: str) -> tuple[int, _WatchlistCursor | None]:
+    """Return (rows already served, keyset position); bare integers are legacy offsets.
+
+    Anything unparseable restarts from the first page rather than failing the request.
+    """
+    value = str(cursor or "").strip()
+    if not value:
+        return 0, None
+    after: _WatchlistCursor | None = None
     try:
-        value = int(str(cursor).strip())
-    except (TypeError, ValueError):
-        return 0
-    return max(0, value)
+        # isdigit() alone also accepts non-ASCII digits such as "²", which int() rejects.
+        if value.isascii() and value.isdigit():
+            seen = int(value)
+        else:
+            payload = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+            if payload["s"] != sort:
+                return 0, None
+            seen = int(payload["n"])
+            after = _WatchlistCursor(key=str(payload["k"]), item_id=uuid.UUID(str(payload["id"])))
+            if sort != "alpha":
+                datetime.fromisoformat(after.key)
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError, OverflowError):
+        return 0, None
+    return min(max(0, seen), _MAX_CURSOR_SEEN), after
+
+
+def _keyset_clause(after: _WatchlistCursor, *, sort: str):
+    if sort == "alpha":
+        return sa.tuple_(sa.func.lower(Title.name), WatchlistItem.id) > sa.tuple_(
+            sa.func.lower(sa.literal(after.key, sa.String)), sa.literal(after.item_id, WatchlistItem.id.type)
+        )
+    position = sa.tuple_(WatchlistItem.created_at, WatchlistItem.id)
+    bound = sa.tuple_(
+        sa.literal(datetime.fromisoformat(after.key), WatchlistItem.created_at.type),
+        sa.literal(after.item_id, WatchlistItem.id.type),
+    )
+    return position > bound if sort == "oldest" else position < bound
 
 
 def _build_watchlist_stmt(
@@ -242,15 +364,10 @@ def _build_watchlist_stmt(
     sort: str,
     include_options: bool,
     include_sort: bool,
+    genre_id: int | None = None,
+    after: _WatchlistCursor | None = None,
 ):
-    stmt = select(WatchlistItem)
-    if include_options:
-        stmt = stmt.options(
-            selectinload(WatchlistItem.title),
-            selectinload(WatchlistItem.added_by_user),
-        )
-
-    stmt = stmt.where(WatchlistItem.group_id == group_id)
+    stmt = select(WatchlistItem).where(WatchlistItem.group_id == group_id)
     joined_title = False
 
     def _ensure_title_join():
@@ -260,6 +377,14 @@ def _build_watchlist_stmt(
         stmt = stmt.join(WatchlistItem.title)
         joined_title = True
 
+    if include_options:
+        # Every item has a title, so load it from the same join the filters and sort use.
+        _ensure_title_join()
+        stmt = stmt.options(
+            contains_eager(WatchlistItem.title),
+            selectinload(WatchlistItem.added_by_user),
+        )
+
     if status:
         stmt = stmt.where(WatchlistItem.status == status)
 
@@ -278,6 +403,15 @@ def _build_watchlist_stmt(
         _ensure_title_join()
         stmt = stmt.where(Title.media_type == media_type)
 
+    if genre_id is not None:
+        _ensure_title_join()
+        stmt = stmt.where(Title.tmdb_genre_ids.any(genre_id))
+
+    if after is not None:
+        if sort == "alpha":
+            _ensure_title_join()
+        stmt = stmt.where(_keyset_clause(after, sort=sort))
+
     if include_sort:
         if sort == "alpha":
             _ensure_title_join()
@@ -290,51 +424,6 @@ def _build_watchlist_stmt(
     return stmt
 
 
-async def _filter_watchlist_by_genre(
-    *,
-    items: list[WatchlistItem],
-    genre_id: int,
-) -> list[WatchlistItem]:
-    if not items:
-        return []
-
-    item_to_key: dict[uuid.UUID, tuple[int, str]] = {}
-    unique_keys: set[tuple[int, str]] = set()
-    for item in items:
-        title = item.title
-        if not title or title.source != "tmdb" or not title.source_id:
-            continue
-        try:
-            tmdb_id = int(title.source_id)
-        except (TypeError, ValueError):
-            continue
-        key = (tmdb_id, title.media_type)
-        item_to_key[item.id] = key
-        unique_keys.add(key)
-
-    if not unique_keys:
-        return []
-
-    async def _load_genre_ids(key: tuple[int, str]) -> tuple[tuple[int, str], set[int]]:
-        tmdb_id, media_type = key
-        taxonomy = await fetch_tmdb_title_taxonomy(tmdb_id=tmdb_id, media_type=media_type)
-        if isinstance(taxonomy, tuple) and len(taxonomy) == 3:
-            _, _, genre_ids = taxonomy
-        else:
-            genre_ids = set()
-        return key, set(genre_ids)
-
-    genre_map = dict(await asyncio.gather(*[_load_genre_ids(key) for key in unique_keys]))
-    out: list[WatchlistItem] = []
-    for item in items:
-        key = item_to_key.get(item.id)
-        if not key:
-            continue
-        if genre_id in genre_map.get(key, set()):
-            out.append(item)
-    return out
-
-
 async def list_watchlist_page(
     db: AsyncSession,
     *,
@@ -349,66 +438,62 @@ async def list_watchlist_page(
     limit: int = 24,
     cursor: str | None = None,
 ) -> WatchlistPage:
-    await assert_user_in_group(db, group_id, user_id)
-
-    offset = _decode_cursor(cursor)
+    seen, after = _decode_cursor(cursor, sort=sort)
+    # Keyset cursors seek past the last row served; legacy integer cursors still use OFFSET.
+    offset = seen if after is None else 0
     page_limit = max(1, min(limit, 100))
 
-    if genre_id is None:
-        count_base = _build_watchlist_stmt(
+    # The total ignores the keyset seek: it counts the whole filtered list, not what remains.
+    count_base = _build_watchlist_stmt(
+        group_id=group_id,
+        status=status,
+        tonight=tonight,
+        q=q,
+        media_type=media_type,
+        sort=sort,
+        include_options=False,
+        include_sort=False,
+        genre_id=genre_id,
+    )
+    count_stmt = select(sa.func.count()).select_from(count_base.subquery())
+    # Either way the count rides along with the page, so one round-trip returns both.
+    total_column = sa.func.count().over() if after is None else count_stmt.scalar_subquery()
+    page_stmt = (
+        _build_watchlist_stmt(
             group_id=group_id,
             status=status,
             tonight=tonight,
             q=q,
             media_type=media_type,
             sort=sort,
-            include_options=False,
-            include_sort=False,
+            include_options=True,
+            include_sort=True,
+            genre_id=genre_id,
+            after=after,
         )
-        count_stmt = select(sa.func.count()).select_from(count_base.subquery())
-        total_count = int((await db.execute(count_stmt)).scalar() or 0)
-        if offset >= total_count:
-            return WatchlistPage(items=[], next_cursor=None, total_count=total_count)
-
-        page_stmt = (
-            _build_watchlist_stmt(
-                group_id=group_id,
-                status=status,
-                tonight=tonight,
-                q=q,
-                media_type=media_type,
-                sort=sort,
-                include_options=True,
-                include_sort=True,
-            )
-            .offset(offset)
-            .limit(page_limit + 1)
-        )
-        rows = (await db.execute(page_stmt)).scalars().all()
-        has_more = len(rows) > page_limit
-        items = rows[:page_limit]
-        next_cursor = str(offset + page_limit) if has_more else None
-        return WatchlistPage(items=items, next_cursor=next_cursor, total_count=total_count)
-
-    # Genre filtering is dynamic (from TMDB taxonomy), so we filter in memory.
-    base_stmt = _build_watchlist_stmt(
-        group_id=group_id,
-        status=status,
-        tonight=tonight,
-        q=q,
-        media_type=media_type,
-        sort=sort,
-        include_options=True,
-        include_sort=True,
+        .where(_membership_clause(group_id, user_id))
+        .add_columns(total_column.label("total_count"))
+        .offset(offset)
+        .limit(page_limit + 1)
     )
-    base_rows = (await db.execute(base_stmt)).scalars().all()
-    filtered = await _filter_watchlist_by_genre(items=base_rows, genre_id=genre_id)
-    total_count = len(filtered)
-    if offset >= total_count:
+    result = (await db.execute(page_stmt)).all()
+    if result:
+        total_count = int(result[0].total_count)
+    else:
+        # No rows: an empty page, or a non-member filtered out by the EXISTS clause.
+        await assert_user_in_group(db, group_id, user_id)
+        if not seen and after is None:
+            return WatchlistPage(items=[], next_cursor=None, total_count=0)
+        # Past the last page no rows carry the count, so ask for it directly.
+        total_count = int((await db.execute(count_stmt)).scalar() or 0)
         return WatchlistPage(items=[], next_cursor=None, total_count=total_count)
 
-    items = filtered[offset : offset + page_limit]
-    next_cursor = str(offset + page_limit) if (offset + page_limit) < total_count else None
+    rows = [row[0] for row in result]
+    has_more = len(rows) > page_limit
+    items = rows[:page_limit]
+    next_cursor = (
+        _encode_cursor(seen=seen + len(items), item=items[-1], sort=sort) if has_more else None
+    )
     return WatchlistPage(items=items, next_cursor=next_cursor, total_count=total_count)
 
 
@@ -421,16 +506,46 @@ async def patch_watchlist_item(
     snoozed_until=UNSET,  
     remove: bool | None,
 ) -> bool:
-    q = select(WatchlistItem).where(WatchlistItem.id == item_id)
-    item = (await db.execute(q)).scalar_one_or_none()
-    if not item:
-        raise ValueError("Not found")
-
-    await assert_user_in_group(db, item.group_id, user_id)
-
     if remove:
-        await db.delete(item)
-        return True
+        # One DELETE guarded by membership; only a miss pays for a lookup to pick the error.
+        deleted = await db.execute(
+            sa.delete(WatchlistItem)
+            .where(
+                WatchlistItem.id == item_id,
+                sa.exists().where(
+                    GroupMembership.group_id == WatchlistItem.group_id,
+                    GroupMembership.user_id == user_id,
+                ),
+            )
+            .returning(WatchlistItem.id)
+        )
+        if deleted.scalar_one_or_none() is not None:
+            return True
+        found = (
+            await db.execute(select(WatchlistItem.id).where(WatchlistItem.id == item_id))
+        ).scalar_one_or_none()
+        if found is None:
+            raise ValueError("Not found")
+        raise PermissionError("Not a member of this group")
+
+    # The membership check rides along with the item lookup instead of a second SELECT.
+    q = sa.lambda_stmt(
+        lambda: select(WatchlistItem, GroupMembership.id)
+        .outerjoin(
+            GroupMembership,
+            sa.and_(
+                GroupMembership.group_id == WatchlistItem.group_id,
+                GroupMembership.user_id == user_id,
+            ),
+        )
+        .where(WatchlistItem.id == item_id)
+    )
+    row = (await db.execute(q)).one_or_none()
+    if row is None:
+        raise ValueError("Not found")
+    item, membership_id = row
+    if membership_id is None:
+        raise PermissionError("Not a member of this group")
 
     changed = False
 
@@ -0,0 +1,53 @@
+"""Helpers shared by the TMDB backfill scripts."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+
+def parse_tmdb_id(source_id: str | None) -> int | None:
+    if not source_id:
+        return None
+    raw = source_id.strip()
+    # isdigit() alone also accepts non-ASCII digits such as "²", which int() rejects.
+    if not (raw.isascii() and raw.isdigit()):
+        return None
+    value = int(raw)
+    return value if value > 0 else None
+
+
+class RateLimiter:
+    """Token bucket shared by all fetch workers: ``rate`` requests/second, bursts up to ``capacity``."""
+
+    def __init__(
+        self,
+        rate: float | None,
+        *,
+        capacity: float = 1,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+        # Defaults to the running loop's clock; tests pass a fake clock and sleep.
+        self._clock = clock
+        self._sleep = sleep
+
+    async def wait(self) -> None:
+        if not self._rate:
+            return
+        async with self._lock:
+            clock = self._clock or asyncio.get_running_loop().time
+            now = clock()
+            if self._updated is not None:
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self._rate)
+                self._tokens = 1
+                self._updated = clock()
+            self._tokens -= 1
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import json
 import logging
+import sqlite3
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Awaitable, Callable
@@ -21,6 +24,7 @@ if str(ROOT_DIR) not in sys.path:
 from app.db.session import AsyncSessionLocal  # noqa: E402
 from app.models.title import Title  # noqa: E402
 from app.services.tmdb import fetch_tmdb_title_details  # noqa: E402
+from scripts._tmdb_backfill_common import RateLimiter, parse_tmdb_id  # noqa: E402
 
 logger = logging.getLogger("backfill_tmdb_title_details")
 
@@ -37,17 +41,48 @@ class BackfillStats:
     fetch_errors: int = 0
 
 
-def _parse_tmdb_id(source_id: str | None) -> int | None:
-    if source_id is None:
-        return None
-    raw = str(source_id).strip()
-    if not raw:
-        return None
-    try:
-        value = int(raw)
-    except (TypeError, ValueError):
-        return None
-    return value if value > 0 else None
+class DetailsCache:
+    """SQLite file of fetched TMDB details, so re-runs skip titles fetched recently."""
+
+    def __init__(self, path: Path, *, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tmdb_details ("
+            " tmdb_id INTEGER NOT NULL, media_type TEXT NOT NULL,"
+            " body TEXT NOT NULL, fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (tmdb_id, media_type))"
+        )
+
+    def get(self, *, tmdb_id: int, media_type: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT body FROM tmdb_details WHERE tmdb_id = ? AND media_type = ? AND fetched_at >= ?",
+            (tmdb_id, media_type, time.time() - self._ttl_seconds),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, *, tmdb_id: int, media_type: str, details: dict[str, Any]) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tmdb_details (tmdb_id, media_type, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (tmdb_id, media_type, json.dumps(details), time.time()),
+            )
+
+    def wrap(self, fetcher: DetailsFetcher) -> DetailsFetcher:
+        async def cached_fetcher(*, tmdb_id: int, media_type: str) -> dict[str, Any]:
+            hit = self.get(tmdb_id=tmdb_id, media_type=media_type)
+            if hit is not None:
+                return hit
+            details = await fetcher(tmdb_id=tmdb_id, media_type=media_type)
+            # The fetcher returns {} on failure; only real answers are kept.
+            if isinstance(details, dict) and details:
+                self.put(tmdb_id=tmdb_id, media_type=media_type, details=details)
+            return details
+
+        return cached_fetcher
+
+    def close(self) -> None:
+        self._conn.close()
 
 
 def _is_blank_text(value: str | None) -> bool:
@@ -91,7 +126,7 @@ def _missing_filter_clause(*, fill_runtime: bool, fill_overview: bool):
         clauses.append(
             sa.or_(
                 Title.overview.is_(None),
-                sa.func.length(sa.func.trim(Title.overview)) == 0,
+                sa.func.length(sa.func.btrim(Title.overview)) == 0,
             )
         )
     if not clauses:
@@ -105,9 +140,11 @@ async def _load_batch(
     after_id: UUID | None,
     batch_size: int,
     filter_clause,
-) -> list[Title]:
+) -> list[sa.Row[Any]]:
+    # Plain rows rather than entities: nothing is added to the identity map or
+    # expired on commit, and only the columns the backfill reads are transferred.
     q = (
-        select(Title)
+        select(Title.id, Title.source_id, Title.media_type, Title.runtime_minutes, Title.overview)
         .where(
             Title.source == "tmdb",
             Title.source_id.is_not(None),
@@ -118,7 +155,58 @@ async def _load_batch(
     )
     if after_id is not None:
         q = q.where(Title.id > after_id)
-    return list((await db.execute(q)).scalars())
+    return list((await db.execute(q)).all())
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    title_id: UUID
+    tmdb_id: int
+    media_type: str
+    runtime_minutes: int | None
+    overview: str | None
+
+
+async def _fetch_details(
+    sem: asyncio.Semaphore,
+    limiter: RateLimiter,
+    details_fetcher: DetailsFetcher,
+    candidate: _Candidate,
+) -> dict[str, Any]:
+    async with sem:
+        await limiter.wait()
+        return await details_fetcher(tmdb_id=candidate.tmdb_id, media_type=candidate.media_type)
+
+
+def _take_candidates(
+    batch: list[sa.Row[Any]],
+    *,
+    stats: BackfillStats,
+    max_items: int | None,
+    verbose: bool,
+) -> tuple[list[_Candidate], bool]:
+    candidates: list[_Candidate] = []
+    for title in batch:
+        if max_items is not None and stats.scanned >= max_items:
+            return candidates, True
+
+        stats.scanned += 1
+        tmdb_id = parse_tmdb_id(title.source_id)
+        if tmdb_id is None:
+            stats.skipped_invalid_source_id += 1
+            if verbose:
+                logger.info("skip invalid source_id title_id=%s source_id=%r", title.id, title.source_id)
+            continue
+        candidates.append(
+            _Candidate(
+                title_id=title.id,
+                tmdb_id=tmdb_id,
+                media_type=title.media_type,
+                runtime_minutes=title.runtime_minutes,
+                overview=title.overview,
+            )
+        )
+    return candidates, False
 
 
 async def run_backfill(
@@ -131,86 +219,115 @@ async def run_backfill(
     fill_runtime: bool,
     fill_overview: bool,
     verbose: bool,
+    concurrency: int = 8,
+    max_rate: float | None = None,
     details_fetcher: DetailsFetcher = fetch_tmdb_title_details,
 ) -> BackfillStats:
     if batch_size <= 0:
         raise ValueError("--batch-size must be greater than 0")
+    if concurrency <= 0:
+        raise ValueError("--concurrency must be greater than 0")
     if max_items is not None and max_items <= 0:
         raise ValueError("--max-items must be greater than 0 when provided")
+    if max_rate is not None and max_rate <= 0:
+        raise ValueError("--max-rate must be greater than 0 when provided")
 
     stats = BackfillStats()
     filter_clause = _missing_filter_clause(fill_runtime=fill_runtime, fill_overview=fill_overview)
-    after_id: UUID | None = None
-    sleep_seconds = max(0, sleep_ms) / 1000
-
-    done = False
-    while not done:
-        batch = await _load_batch(
-            db,
-            after_id=after_id,
-            batch_size=batch_size,
-            filter_clause=filter_clause,
+    sem = asyncio.Semaphore(concurrency)
+    if max_rate is not None:
+        limiter = RateLimiter(max_rate, capacity=max(1.0, max_rate))
+    else:
+        # Legacy pacing: one request start per sleep_ms, no bursts.
+        limiter = RateLimiter(1000 / sleep_ms if sleep_ms > 0 else None)
+
+    def start_fetches(candidates: list[_Candidate]) -> asyncio.Future:
+        return asyncio.gather(
+            *(_fetch_details(sem, limiter, details_fetcher, candidate) for candidate in candidates),
+            return_exceptions=True,
         )
-        if not batch:
-            break
-
-        for title in batch:
-            if max_items is not None and stats.scanned >= max_items:
-                done = True
-                break
-
-            stats.scanned += 1
-            tmdb_id = _parse_tmdb_id(title.source_id)
-            if tmdb_id is None:
-                stats.skipped_invalid_source_id += 1
-                if verbose:
-                    logger.info("skip invalid source_id title_id=%s source_id=%r", title.id, title.source_id)
-                continue
-
-            try:
-                details = await details_fetcher(tmdb_id=tmdb_id, media_type=title.media_type)
-            except Exception:
-                stats.fetch_errors += 1
-                logger.exception("tmdb fetch failed title_id=%s tmdb_id=%s", title.id, tmdb_id)
-                continue
-
-            changed, runtime_out, overview_out = _derive_patch(
-                current_runtime=title.runtime_minutes,
-                current_overview=title.overview,
-                details=details if isinstance(details, dict) else {},
-                fill_runtime=fill_runtime,
-                fill_overview=fill_overview,
+
+    batch = await _load_batch(db, after_id=None, batch_size=batch_size, filter_clause=filter_clause)
+    after_id = batch[-1].id if batch else None
+    candidates, done = _take_candidates(batch, stats=stats, max_items=max_items, verbose=verbose)
+    fetching = start_fetches(candidates)
+    try:
+        while batch:
+            results = await fetching
+
+            patches: list[dict[str, Any]] = []
+            # The session is not safe for concurrent use, so results are applied serially.
+            for candidate, details in zip(candidates, results):
+                if isinstance(details, BaseException):
+                    if not isinstance(details, Exception):
+                        raise details
+                    stats.fetch_errors += 1
+                    logger.error(
+                        "tmdb fetch failed title_id=%s tmdb_id=%s",
+                        candidate.title_id,
+                        candidate.tmdb_id,
+                        exc_info=(type(details), details, details.__traceback__),
+                    )
+                    continue
+
+                changed, runtime_out, overview_out = _derive_patch(
+                    current_runtime=candidate.runtime_minutes,
+                    current_overview=candidate.overview,
+                    details=details if isinstance(details, dict) else {},
+                    fill_runtime=fill_runtime,
+                    fill_overview=fill_overview,
+                )
+                if not changed:
+                    stats.unchanged += 1
+                else:
+                    stats.would_update += 1
+                    if verbose:
+                        logger.info(
+                            "candidate update title_id=%s tmdb_id=%s runtime=%r overview=%r",
+                            candidate.title_id,
+                            candidate.tmdb_id,
+                            runtime_out,
+                            bool(overview_out),
+                        )
+                    if apply:
+                        patches.append(
+                            {"id": candidate.title_id, "runtime_minutes": runtime_out, "overview": overview_out}
+                        )
+                        stats.updated += 1
+
+            if apply and patches:
+                try:
+                    # ORM bulk UPDATE by primary key: one executemany instead of a flush per row.
+                    await db.execute(sa.update(Title), patches)
+                except Exception:
+                    await db.rollback()
+                    raise
+
+            # Load the next batch before ending the transaction so its TMDB requests
+            # run while this batch commits.
+            batch = [] if done else await _load_batch(
+                db,
+                after_id=after_id,
+                batch_size=batch_size,
+                filter_clause=filter_clause,
             )
-            if not changed:
-                stats.unchanged += 1
+            if batch:
+                after_id = batch[-1].id
+            candidates, done = _take_candidates(batch, stats=stats, max_items=max_items, verbose=verbose)
+            fetching = start_fetches(candidates)
+
+            if apply:
+                try:
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
             else:
-                stats.would_update += 1
-                if verbose:
-                    logger.info(
-                        "candidate update title_id=%s tmdb_id=%s runtime=%r overview=%r",
-                        title.id,
-                        tmdb_id,
-                        runtime_out,
-                        bool(overview_out),
-                    )
-                if apply:
-                    title.runtime_minutes = runtime_out
-                    title.overview = overview_out
-                    stats.updated += 1
-
-            if sleep_seconds > 0:
-                await asyncio.sleep(sleep_seconds)
-
-        after_id = batch[-1].id
-        if apply:
-            try:
-                await db.commit()
-            except Exception:
+                # End the read transaction and release any snapshot state.
                 await db.rollback()
-                raise
-        else:
-            # End the read transaction and release any snapshot state.
-            await db.rollback()
+    finally:
+        if not fetching.done():
+            fetching.cancel()
 
     return stats
 
@@ -241,7 +358,19 @@ def _parse_args() -> argparse.Namespace:
         "--sleep-ms",
         type=int,
         default=100,
-        help="Optional sleep between TMDB requests in milliseconds.",
+        help="Minimum spacing between TMDB request starts in milliseconds (ignored with --max-rate).",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=None,
+        help="TMDB requests per second, allowing bursts of up to one second's worth.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of TMDB requests in flight at once.",
     )
     parser.add_argument(
         "--only-missing-runtime",
@@ -253,6 +382,18 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Only fill overview for rows where overview is blank or null.",
     )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        default=None,
+        help="SQLite file caching TMDB responses across runs (disabled when omitted).",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=168,
+        help="How long cached TMDB responses are reused.",
+    )
     parser.add_argument("--verbose", action="store_true", help="Log row-level actions.")
     args = parser.parse_args()
 
@@ -278,17 +419,30 @@ async def _main_async(args: argparse.Namespace) -> BackfillStats:
     fill_runtime = not args.only_missing_overview
     fill_overview = not args.only_missing_runtime
 
-    async with AsyncSessionLocal() as db:
-        return await run_backfill(
-            db,
-            apply=args.apply,
-            batch_size=args.batch_size,
-            max_items=args.max_items,
-            sleep_ms=args.sleep_ms,
-            fill_runtime=fill_runtime,
-            fill_overview=fill_overview,
-            verbose=args.verbose,
-        )
+    cache = None
+    details_fetcher: DetailsFetcher = fetch_tmdb_title_details
+    if args.cache_file is not None:
+        cache = DetailsCache(args.cache_file, ttl_seconds=args.cache_ttl_hours * 3600)
+        details_fetcher = cache.wrap(details_fetcher)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            return await run_backfill(
+                db,
+                apply=args.apply,
+                batch_size=args.batch_size,
+                max_items=args.max_items,
+                sleep_ms=args.sleep_ms,
+                concurrency=args.concurrency,
+                max_rate=args.max_rate,
+                fill_runtime=fill_runtime,
+                fill_overview=fill_overview,
+                verbose=args.verbose,
+                details_fetcher=details_fetcher,
+            )
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 def main() -> int:
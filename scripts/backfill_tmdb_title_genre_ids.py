@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.db.session import AsyncSessionLocal  # noqa: E402
+from app.models.title import Title  # noqa: E402
+from app.services.tmdb import fetch_tmdb_title_genre_ids  # noqa: E402
+from scripts._tmdb_backfill_common import RateLimiter, parse_tmdb_id  # noqa: E402
+
+logger = logging.getLogger("backfill_tmdb_title_genre_ids")
+
+GenreIdsFetcher = Callable[..., Awaitable[list[int] | None]]
+
+
+@dataclass
+class BackfillStats:
+    scanned: int = 0
+    would_update: int = 0
+    updated: int = 0
+    skipped_invalid_source_id: int = 0
+    fetch_errors: int = 0
+
+
+async def _load_batch(db: AsyncSession, *, after_id: UUID | None, batch_size: int) -> list[sa.Row[Any]]:
+    q = (
+        select(Title.id, Title.source_id, Title.media_type)
+        .where(
+            Title.source == "tmdb",
+            Title.source_id.is_not(None),
+            Title.tmdb_genre_ids.is_(None),
+        )
+        .order_by(Title.id.asc())
+        .limit(batch_size)
+    )
+    if after_id is not None:
+        q = q.where(Title.id > after_id)
+    return list((await db.execute(q)).all())
+
+
+async def run_backfill(
+    db: AsyncSession,
+    *,
+    apply: bool,
+    batch_size: int,
+    max_items: int | None,
+    verbose: bool,
+    concurrency: int = 8,
+    max_rate: float | None = None,
+    genre_ids_fetcher: GenreIdsFetcher = fetch_tmdb_title_genre_ids,
+) -> BackfillStats:
+    if batch_size <= 0:
+        raise ValueError("--batch-size must be greater than 0")
+    if concurrency <= 0:
+        raise ValueError("--concurrency must be greater than 0")
+    if max_items is not None and max_items <= 0:
+        raise ValueError("--max-items must be greater than 0 when provided")
+    if max_rate is not None and max_rate <= 0:
+        raise ValueError("--max-rate must be greater than 0 when provided")
+
+    stats = BackfillStats()
+    sem = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(max_rate, capacity=max(1.0, max_rate or 1.0))
+
+    async def fetch(tmdb_id: int, media_type: str) -> list[int] | None:
+        async with sem:
+            await limiter.wait()
+            return await genre_ids_fetcher(tmdb_id=tmdb_id, media_type=media_type)
+
+    after_id: UUID | None = None
+    while max_items is None or stats.scanned < max_items:
+        limit = batch_size if max_items is None else min(batch_size, max_items - stats.scanned)
+        batch = await _load_batch(db, after_id=after_id, batch_size=limit)
+        if not batch:
+            break
+        after_id = batch[-1].id
+        stats.scanned += len(batch)
+
+        candidates: list[tuple[UUID, int, str]] = []
+        for row in batch:
+            tmdb_id = parse_tmdb_id(row.source_id)
+            if tmdb_id is None:
+                stats.skipped_invalid_source_id += 1
+                if verbose:
+                    logger.info("skip invalid source_id title_id=%s source_id=%r", row.id, row.source_id)
+                continue
+            candidates.append((row.id, tmdb_id, row.media_type))
+
+        results = await asyncio.gather(
+            *(fetch(tmdb_id, media_type) for _, tmdb_id, media_type in candidates),
+            return_exceptions=True,
+        )
+
+        patches: list[dict[str, Any]] = []
+        for (title_id, tmdb_id, _), genre_ids in zip(candidates, results):
+            if isinstance(genre_ids, BaseException) and not isinstance(genre_ids, Exception):
+                raise genre_ids
+            # None is a failed lookup; the row stays NULL so a later run retries it.
+            if genre_ids is None or isinstance(genre_ids, Exception):
+                stats.fetch_errors += 1
+                logger.warning("tmdb genre lookup failed title_id=%s tmdb_id=%s", title_id, tmdb_id)
+                continue
+            stats.would_update += 1
+            if verbose:
+                logger.info("candidate update title_id=%s tmdb_id=%s genre_ids=%r", title_id, tmdb_id, genre_ids)
+            if apply:
+                # An empty list is a real answer and is stored, so the title is not fetched again.
+                patches.append({"id": title_id, "tmdb_genre_ids": list(genre_ids)})
+
+        if apply:
+            try:
+                if patches:
+                    await db.execute(sa.update(Title), patches)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            stats.updated += len(patches)
+        else:
+            await db.rollback()
+
+    return stats
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Backfill missing TMDB genre ids in titles table.")
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument(
+        "--apply",
+        action="store_true",
+        help="Persist changes. Without this flag, the script runs in dry-run mode.",
+    )
+    mode_group.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Explicitly run in dry-run mode (default behavior).",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="Number of titles processed per batch.")
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=None,
+        help="Optional cap for number of rows scanned.",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=10,
+        help="TMDB requests per second, allowing bursts of up to one second's worth.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of TMDB requests in flight at once.",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log row-level actions.")
+    return parser.parse_args()
+
+
+def _print_summary(*, apply: bool, stats: BackfillStats) -> None:
+    mode = "apply" if apply else "dry-run"
+    print("TMDB title genre ids backfill complete")
+    print(f"mode: {mode}")
+    print(f"scanned: {stats.scanned}")
+    print(f"would_update: {stats.would_update}")
+    print(f"updated: {stats.updated}")
+    print(f"skipped_invalid_source_id: {stats.skipped_invalid_source_id}")
+    print(f"fetch_errors: {stats.fetch_errors}")
+
+
+async def _main_async(args: argparse.Namespace) -> BackfillStats:
+    async with AsyncSessionLocal() as db:
+        return await run_backfill(
+            db,
+            apply=args.apply,
+            batch_size=args.batch_size,
+            max_items=args.max_items,
+            concurrency=args.concurrency,
+            max_rate=args.max_rate,
+            verbose=args.verbose,
+        )
+
+
+def main() -> int:
+    args = _parse_args()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+
+    stats = asyncio.run(_main_async(args))
+    _print_summary(apply=args.apply, stats=stats)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
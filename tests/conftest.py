@@ -49,6 +49,12 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def asgi_transport():
+    # Stateless wrapper around the app; one instance serves every client in the run.
+    return ASGITransport(app=fastapi_app)
+
+
 @pytest.fixture
 async def db_session():
     async with AsyncSessionLocal() as session:
@@ -56,7 +62,7 @@ async def db_session():
 
 
 @pytest.fixture
-async def client(db_session):
+async def client(db_session, asgi_transport):
     """
     Overrides app.db.session.get_db_session so both:
     - Depends(get_db_session)
@@ -69,8 +75,7 @@ async def client(db_session):
 
     fastapi_app.dependency_overrides[get_db_session] = _override_get_db_session
 
-    transport = ASGITransport(app=fastapi_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as c:
         yield c
 
     fastapi_app.dependency_overrides.pop(get_db_session, None)
@@ -92,11 +97,10 @@ def unique_str():
 
 
 @pytest.fixture
-def client_factory():
+def client_factory(asgi_transport):
     @asynccontextmanager
     async def _factory():
-        transport = ASGITransport(app=fastapi_app)
-        async with AsyncClient(transport=transport, base_url="http://test") as c:
+        async with AsyncClient(transport=asgi_transport, base_url="http://test") as c:
             yield c
 
     return _factory
@@ -1,9 +1,12 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import update
 import pytest
 
+from app.core.config import settings
 from app.models.title import Title
+from app.schemas.tonight_constraints import TonightConstraints
+from app.services import sessions as sessions_service
 from app.services.ai import AIError, AIRerankResult
 
 
@@ -34,9 +37,6 @@ async def _add_tmdb_item(client, *, group_id: str, tmdb_id: int, title: str, med
 async def test_session_create_ai_parse_applies_constraints_and_marks_ai_used_false_if_rerank_off(
     async_client, monkeypatch, db_session, user_factory, login_helper
 ):
-    from app.services import sessions as sessions_service
-    from app.schemas.tonight_constraints import TonightConstraints
-
     async def fake_parse(*, baseline: TonightConstraints, text: str):
         refined = baseline.model_copy(deep=True)
         refined.format = "movie"
@@ -68,9 +68,10 @@ async def test_session_create_ai_parse_applies_constraints_and_marks_ai_used_fal
         uuid.UUID(movie_long["title"]["id"]): 150,
         uuid.UUID(tv_item["title"]["id"]): 90,
     }
-    rows = await db_session.execute(select(Title).where(Title.id.in_(title_ids.keys())))
-    for t in rows.scalars():
-        t.runtime_minutes = title_ids[t.id]
+    await db_session.execute(
+        update(Title),
+        [{"id": title_id, "runtime_minutes": runtime} for title_id, runtime in title_ids.items()],
+    )
     await db_session.commit()
 
     payload = {
@@ -99,7 +100,6 @@ async def test_session_create_ai_parse_applies_constraints_and_marks_ai_used_fal
 
 @pytest.mark.anyio
 async def test_ai_rerank_reorders_candidates_and_stores_why(async_client, monkeypatch, user_factory, login_helper):
-    from app.services import sessions as sessions_service
     order_holder: dict[str, list[str]] = {}
 
     async def fake_rerank(*, constraints, candidates):
@@ -136,8 +136,6 @@ async def test_ai_rerank_reorders_candidates_and_stores_why(async_client, monkey
 
 @pytest.mark.anyio
 async def test_ai_rerank_invalid_ids_falls_back_deterministic(async_client, monkeypatch, user_factory, login_helper):
-    from app.services import sessions as sessions_service
-
     async def fake_rerank(*, constraints, candidates):
         return AIRerankResult(ordered_ids=["not-a-real-id"], top_id=None, why="Nope")
 
@@ -169,8 +167,6 @@ async def test_ai_rerank_invalid_ids_falls_back_deterministic(async_client, monk
 
 @pytest.mark.anyio
 async def test_missing_openai_key_does_not_break_session_creation(async_client, monkeypatch, user_factory, login_helper):
-    from app.core.config import settings
-
     monkeypatch.setattr(settings, "openai_api_key", None)
 
     email = f"{_u('d')}@x.com"
@@ -4,7 +4,10 @@ import pytest
 import jwt
 from sqlalchemy import select
 
+from app.api.routes import auth as auth_routes
+from app.api.routes.auth import _upsert_oauth_user
 from app.core.config import settings
+from app.core.security import create_access_token
 from app.models.auth_session import AuthSession
 from app.models.magic_link_grant import MagicLinkGrant
 from app.models.oauth_identity import OAuthIdentity
@@ -12,6 +15,40 @@ from app.models.oauth_identity import OAuthIdentity
 pytestmark = pytest.mark.anyio
 
 
+class _FakeProfileResponse:
+    is_success = True
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _FakeGoogleClient:
+    """Stands in for the authlib Google client; ``profile`` answers the userinfo fallback."""
+
+    def __init__(self, claims, *, id_token=True, profile=None):
+        self.claims = claims
+        self.id_token = id_token
+        self.profile = profile
+
+    async def authorize_access_token(self, request):
+        _ = request
+        return {"userinfo": self.claims}
+
+    async def parse_id_token(self, request, token):
+        _ = (request, token)
+        return self.claims if self.id_token else None
+
+    async def get(self, path, token=None):
+        _ = token
+        if self.profile is None:
+            raise AssertionError(f"unexpected profile fetch: {path}")
+        assert path == "userinfo"
+        return _FakeProfileResponse(self.profile)
+
+
 async def test_register_login_me(client, user_factory, login_helper):
     user = await user_factory(client, display_name="A")
     await login_helper(client, email=user["email"], password=user["password"])
@@ -146,8 +183,6 @@ async def test_oauth_login_preserves_custom_display_name(
     db_session,
     user_factory,
 ):
-    from app.api.routes.auth import _upsert_oauth_user
-
     user_data = await user_factory(client, display_name="Chosen Name")
 
     user = await _upsert_oauth_user(
@@ -212,8 +247,6 @@ async def test_login_persists_typed_jti_session(
 
 
 async def test_access_token_requires_persisted_session(client, user_factory):
-    from app.core.security import create_access_token
-
     user = await user_factory(client)
     token, _expires_at = create_access_token(subject=user["id"], jti="missing-session")
     client.cookies.set("access_token", token)
@@ -240,46 +273,21 @@ async def test_logout_clears_oauth_session_cookie(client):
 async def test_google_callback_fetches_missing_avatar_from_userinfo(
     client, db_session, monkeypatch
 ):
-    from app.api.routes import auth as auth_routes
-
-    class _FakeProfileResponse:
-        is_success = True
-
-        @staticmethod
-        def json():
-            return {
-                "email": "google-avatar@example.com",
-                "sub": "google-avatar-subject",
-                "email_verified": True,
-                "name": "Google Avatar",
-                "picture": "https://example.com/google-avatar.png",
-            }
-
-    class _FakeGoogleClient:
-        async def authorize_access_token(self, request):
-            _ = request
-            return {
-                "userinfo": {
-                    "email": "google-avatar@example.com",
-                    "sub": "google-avatar-subject",
-                    "email_verified": True,
-                    "name": "Google Avatar",
-                }
-            }
-
-        async def parse_id_token(self, request, token):
-            _ = (request, token)
-            return None
-
-        async def get(self, path, token=None):
-            _ = token
-            assert path == "userinfo"
-            return _FakeProfileResponse()
-
+    claims = {
+        "email": "google-avatar@example.com",
+        "sub": "google-avatar-subject",
+        "email_verified": True,
+        "name": "Google Avatar",
+    }
+    fake = _FakeGoogleClient(
+        claims,
+        id_token=False,
+        profile={**claims, "picture": "https://example.com/google-avatar.png"},
+    )
     monkeypatch.setattr(
         auth_routes,
         "get_oauth_client",
-        lambda provider: _FakeGoogleClient() if provider == "google" else None,
+        lambda provider: fake if provider == "google" else None,
     )
 
     callback = await client.get("/auth/google/callback", follow_redirects=False)
@@ -300,23 +308,6 @@ async def test_google_callback_fetches_missing_avatar_from_userinfo(
 
 
 async def test_google_callback_requires_subject_and_verified_email(client, monkeypatch):
-    from app.api.routes import auth as auth_routes
-
-    class _FakeGoogleClient:
-        def __init__(self, claims):
-            self.claims = claims
-
-        async def authorize_access_token(self, request):
-            _ = request
-            return {"userinfo": self.claims}
-
-        async def parse_id_token(self, request, token):
-            _ = (request, token)
-            return self.claims
-
-        async def get(self, path, token=None):
-            raise AssertionError(f"unexpected profile fetch: {path}")
-
     for claims, expected_reason in (
         (
             {
@@ -349,8 +340,6 @@ async def test_google_callback_requires_subject_and_verified_email(client, monke
 async def test_google_does_not_silently_link_existing_email(
     client, db_session, user_factory, monkeypatch
 ):
-    from app.api.routes import auth as auth_routes
-
     existing = await user_factory(client, email="owned-email@example.com")
     claims = {
         "email": existing["email"],
@@ -360,16 +349,7 @@ async def test_google_does_not_silently_link_existing_email(
         "picture": "https://example.com/provider.png",
     }
 
-    class _FakeGoogleClient:
-        async def authorize_access_token(self, request):
-            _ = request
-            return {"userinfo": claims}
-
-        async def parse_id_token(self, request, token):
-            _ = (request, token)
-            return claims
-
-    monkeypatch.setattr(auth_routes, "get_oauth_client", lambda provider: _FakeGoogleClient())
+    monkeypatch.setattr(auth_routes, "get_oauth_client", lambda provider: _FakeGoogleClient(claims))
 
     callback = await client.get("/auth/google/callback", follow_redirects=False)
     assert callback.status_code == 302
@@ -387,8 +367,6 @@ async def test_google_does_not_silently_link_existing_email(
 async def test_google_links_existing_account_when_google_is_email_authority(
     client, db_session, user_factory, monkeypatch
 ):
-    from app.api.routes import auth as auth_routes
-
     existing = await user_factory(client, email="existing-user@gmail.com")
     claims = {
         "email": existing["email"],
@@ -398,17 +376,8 @@ async def test_google_links_existing_account_when_google_is_email_authority(
         "picture": "https://lh3.googleusercontent.com/avatar",
     }
 
-    class _FakeGoogleClient:
-        async def authorize_access_token(self, request):
-            _ = request
-            return {"userinfo": claims}
-
-        async def parse_id_token(self, request, token):
-            _ = (request, token)
-            return claims
-
     monkeypatch.setattr(
-        auth_routes, "get_oauth_client", lambda provider: _FakeGoogleClient()
+        auth_routes, "get_oauth_client", lambda provider: _FakeGoogleClient(claims)
     )
 
     callback = await client.get("/auth/google/callback", follow_redirects=False)
@@ -430,8 +399,6 @@ async def test_google_links_existing_account_when_google_is_email_authority(
 
 
 async def test_magic_link_request_sends_email_when_configured(client, monkeypatch):
-    from app.api.routes import auth as auth_routes
-
     sent_payload: dict[str, str] = {}
 
     async def _fake_send_magic_link_email(*, to_email: str, magic_link_url: str):
@@ -469,8 +436,6 @@ async def test_magic_link_request_sends_email_when_configured(client, monkeypatc
 async def test_magic_link_verify_creates_user_and_authenticates(
     client, monkeypatch
 ):
-    from app.api.routes import auth as auth_routes
-
     sent: dict[str, str] = {}
 
     async def _send(*, to_email: str, magic_link_url: str):
@@ -540,8 +505,6 @@ async def test_magic_link_verify_only_accepts_strict_post_json(client):
 async def test_magic_link_is_intent_bound_hashed_and_one_time(
     client, client_factory, db_session, monkeypatch
 ):
-    from app.api.routes import auth as auth_routes
-
     sent: dict[str, str] = {}
 
     async def _send(*, to_email: str, magic_link_url: str):
@@ -597,8 +560,6 @@ async def test_magic_link_is_intent_bound_hashed_and_one_time(
 
 
 async def test_local_auth_bypass_requires_configuration(client, monkeypatch):
-    from app.api.routes import auth as auth_routes
-
     monkeypatch.setattr(auth_routes.settings, "env", "test")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_token", None)
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_email", None)
@@ -611,8 +572,6 @@ async def test_local_auth_bypass_requires_configuration(client, monkeypatch):
 
 
 async def test_local_auth_bypass_rejects_invalid_token(client, monkeypatch):
-    from app.api.routes import auth as auth_routes
-
     monkeypatch.setattr(auth_routes.settings, "env", "test")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_token", "expected-token")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_email", "local@example.com")
@@ -623,8 +582,6 @@ async def test_local_auth_bypass_rejects_invalid_token(client, monkeypatch):
 
 
 async def test_local_auth_bypass_is_hidden_outside_local_env(client, monkeypatch):
-    from app.api.routes import auth as auth_routes
-
     monkeypatch.setattr(auth_routes.settings, "env", "production")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_token", "expected-token")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_email", "local@example.com")
@@ -641,8 +598,6 @@ async def test_local_auth_bypass_is_hidden_outside_local_env(client, monkeypatch
 async def test_local_auth_bypass_creates_user_and_authenticates(
     client, db_session, monkeypatch
 ):
-    from app.api.routes import auth as auth_routes
-
     monkeypatch.setattr(auth_routes.settings, "env", "test")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_token", "expected-token")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_email", "local@example.com")
@@ -672,8 +627,6 @@ async def test_local_auth_bypass_creates_user_and_authenticates(
 
 
 async def test_local_auth_bypass_supports_secondary_user(client, client_factory, monkeypatch):
-    from app.api.routes import auth as auth_routes
-
     monkeypatch.setattr(auth_routes.settings, "env", "test")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_token", "primary-token")
     monkeypatch.setattr(auth_routes.settings, "local_auth_bypass_email", "primary@example.com")
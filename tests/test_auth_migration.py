@@ -9,7 +9,12 @@ def test_auth_migration_is_in_head_chain_and_matches_registered_tables():
     config = Config("alembic.ini")
     scripts = ScriptDirectory.from_config(config)
 
-    assert scripts.get_current_head() == "a2c4e6f8b0d2"
+    assert scripts.get_current_head() == "f2b4c6e8a0d2"
+    assert scripts.get_revision("f2b4c6e8a0d2").down_revision == "e0a2c4e6f8b0"
+    assert scripts.get_revision("e0a2c4e6f8b0").down_revision == "d8f0b2c4e6a8"
+    assert scripts.get_revision("d8f0b2c4e6a8").down_revision == "c6e8a0b2d4f6"
+    assert scripts.get_revision("c6e8a0b2d4f6").down_revision == "b4d6f8a0c2e4"
+    assert scripts.get_revision("b4d6f8a0c2e4").down_revision == "a2c4e6f8b0d2"
     assert scripts.get_revision("a2c4e6f8b0d2").down_revision == "f1b3d5e7a9c1"
     assert scripts.get_revision("f1b3d5e7a9c1").down_revision == "e9a1b3c5d7f9"
     assert {
@@ -3,11 +3,13 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import delete, select
+from sqlalchemy.orm import selectinload
 
 from app.db.session import AsyncSessionLocal
 from app.models.tonight_session import TonightSession
 from app.models.tonight_session_participant import TonightSessionParticipant
 from app.models.tonight_session_vote_snapshot import TonightSessionVoteSnapshot
+from app.services.session_history import _ensure_candidate_metadata_snapshots
 from social_helpers import add_friend_to_group, create_friendship
 
 
@@ -511,3 +513,30 @@ async def test_completion_emits_semantic_realtime_events(
     assert response.status_code == 200, response.text
     assert session_events == ["session_completed"]
     assert group_events == ["session_completed"]
+
+
+@pytest.mark.anyio
+async def test_partial_candidate_snapshot_is_filled_from_live_title(
+    async_client, user_factory, login_helper
+):
+    _, _, _, session_id = await _create_winner(
+        async_client, user_factory, login_helper
+    )
+    async with AsyncSessionLocal() as db:
+        session = (
+            await db.execute(
+                select(TonightSession)
+                .options(selectinload(TonightSession.candidates))
+                .where(TonightSession.id == session_id)
+            )
+        ).scalar_one()
+        candidate = session.candidates[0]
+        assert candidate.source_title_id is not None
+        candidate.title_name = None
+        candidate.poster_path = None
+        await db.commit()
+
+        await _ensure_candidate_metadata_snapshots(db, session)
+
+        assert candidate.title_name in {"First Choice", "Second Choice"}
+        assert candidate.poster_path in {"/7301.jpg", "/7302.jpg"}
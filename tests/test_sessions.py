@@ -1,7 +1,14 @@
 from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+import uuid
 
 import pytest
 
+from app.api.routes import sessions as session_routes
+from app.schemas.tonight_constraints import TonightConstraints
+from app.services import sessions as sessions_service
+from app.services import watchlist as watchlist_service
+from app.services.ai import AIError, AIRerankResult
 from app.services.sessions import _normalize_watch_party_url
 
 from social_helpers import (
@@ -37,8 +44,6 @@ async def test_group_leader_can_set_watch_party_link_and_members_can_read(
     user_factory,
     login_helper,
 ):
-    from app.api.routes import sessions as session_routes
-
     broadcasts: list[tuple[str, str]] = []
 
     async def fake_broadcast(session_id, *, reason: str):
@@ -301,9 +306,6 @@ async def test_group_leader_can_set_non_join_teleparty_link(
 @pytest.mark.anyio
 async def test_create_session_freezes_deck_and_returns_order(async_client, monkeypatch, user_factory, login_helper):
     # Patch AI so it deterministically reorders candidates
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIRerankResult
-    from app.schemas.tonight_constraints import TonightConstraints
 
     async def fake_parse(*, baseline: TonightConstraints, text: str):
         baseline.free_text = text.strip()
@@ -455,9 +457,6 @@ async def test_free_text_anime_only_strictly_filters_deck(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2101:
@@ -513,9 +512,6 @@ async def test_free_text_actor_filter_restricts_to_requested_person(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_people(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2201:
@@ -571,9 +567,6 @@ async def test_free_text_studio_filter_restricts_to_requested_company(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_companies(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2251:
@@ -629,9 +622,6 @@ async def test_free_text_studio_filter_uses_web_distributor_evidence(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_companies(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2253:
@@ -694,9 +684,6 @@ async def test_free_text_similarity_phrase_relaxes_strict_studio_and_anime_filte
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_companies(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2261:
@@ -767,9 +754,6 @@ async def test_free_text_happy_alias_maps_to_feel_good_mood(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2265:
@@ -825,9 +809,6 @@ async def test_ai_rerank_payload_includes_tmdb_metadata(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     captured: dict[str, list[dict]] = {}
 
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
@@ -911,9 +892,6 @@ async def test_free_text_directed_by_filter_restricts_to_requested_person(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_people(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2301:
@@ -969,9 +947,6 @@ async def test_free_text_locale_genre_and_exclusion_filters(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 2401:
@@ -1044,9 +1019,6 @@ async def test_free_text_year_and_format_filters(
     user_factory,
     login_helper,
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_rerank(*, constraints, candidates):
         _ = (constraints, candidates)
         raise AIError("disable rerank")
@@ -1095,9 +1067,6 @@ async def test_free_text_year_and_format_filters(
 
 @pytest.mark.anyio
 async def test_mood_tags_use_synonyms_and_tmdb_taxonomy(async_client, monkeypatch, user_factory, login_helper):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 301:
@@ -1150,9 +1119,6 @@ async def test_mood_tags_use_synonyms_and_tmdb_taxonomy(async_client, monkeypatc
 
 @pytest.mark.anyio
 async def test_mood_matching_falls_back_when_no_taxonomy_hits(async_client, monkeypatch, user_factory, login_helper):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = (tmdb_id, media_type)
         return set(), set()
@@ -1200,9 +1166,6 @@ async def test_mood_matching_falls_back_when_no_taxonomy_hits(async_client, monk
 
 @pytest.mark.anyio
 async def test_mood_tags_match_from_tmdb_genre_ids(async_client, monkeypatch, user_factory, login_helper):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 501:
@@ -1257,9 +1220,6 @@ async def test_mood_tags_match_from_tmdb_genre_ids(async_client, monkeypatch, us
 async def test_real_tmdb_genre_tag_science_fiction_is_supported(
     async_client, monkeypatch, user_factory, login_helper
 ):
-    from app.services import sessions as sessions_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = media_type
         if tmdb_id == 701:
@@ -1313,10 +1273,6 @@ async def test_real_tmdb_genre_tag_science_fiction_is_supported(
 async def test_runtime_vibe_tag_under_30_prefers_short_tv_titles(
     async_client, monkeypatch, user_factory, login_helper
 ):
-    from app.services import sessions as sessions_service
-    from app.services import watchlist as watchlist_service
-    from app.services.ai import AIError
-
     async def fake_taxonomy(*, tmdb_id: int, media_type: str):
         _ = (tmdb_id, media_type)
         return set(), set(), set()
@@ -1568,3 +1524,20 @@ def test_watch_party_url_accepts_exact_https_hostname():
     url = "https://www.teleparty.com/join/abc123"
 
     assert _normalize_watch_party_url(url) == url
+
+
+@pytest.mark.anyio
+async def test_repeated_round_candidate_does_not_tie_with_itself():
+    kept, rejected = uuid.uuid4(), uuid.uuid4()
+    runtime = {
+        "initial_candidate_ids": [str(kept), str(rejected), str(kept)],
+        "rounds": {"1": {"votes": {str(uuid.uuid4()): {str(rejected): "no"}}}},
+    }
+    s = SimpleNamespace(
+        constraints={sessions_service.SESSION_RUNTIME_KEY: runtime},
+        candidates=[],
+    )
+
+    winner, tied = await sessions_service._compute_winner_or_tie(None, s)
+
+    assert (winner, tied) == (kept, [])
@@ -1,17 +1,33 @@
-from scripts.backfill_tmdb_title_details import _derive_patch, _is_blank_text, _parse_tmdb_id
+import asyncio
+import uuid
+
+import pytest
+import sqlalchemy as sa
+
+from app.models.title import Title
+from scripts._tmdb_backfill_common import RateLimiter, parse_tmdb_id
+from scripts.backfill_tmdb_title_details import (
+    DetailsCache,
+    _derive_patch,
+    _is_blank_text,
+    run_backfill,
+)
 
 
 def test_parse_tmdb_id_accepts_positive_int_string():
-    assert _parse_tmdb_id("603") == 603
-    assert _parse_tmdb_id("  42  ") == 42
+    assert parse_tmdb_id("603") == 603
+    assert parse_tmdb_id("  42  ") == 42
 
 
 def test_parse_tmdb_id_rejects_invalid_values():
-    assert _parse_tmdb_id(None) is None
-    assert _parse_tmdb_id("") is None
-    assert _parse_tmdb_id("abc") is None
-    assert _parse_tmdb_id("-10") is None
-    assert _parse_tmdb_id("0") is None
+    assert parse_tmdb_id(None) is None
+    assert parse_tmdb_id("") is None
+    assert parse_tmdb_id("abc") is None
+    assert parse_tmdb_id("-10") is None
+    assert parse_tmdb_id("0") is None
+    assert parse_tmdb_id("+7") is None
+    assert parse_tmdb_id("12.5") is None
+    assert parse_tmdb_id("²") is None
 
 
 def test_is_blank_text():
@@ -58,3 +74,165 @@ def test_derive_patch_respects_runtime_only_mode():
     assert changed is True
     assert runtime_out == 121
     assert overview_out is None
+
+
+async def test_run_backfill_fetches_concurrently_and_counts_failures(db_session):
+    failing_id = 900_000 + uuid.uuid4().int % 50_000
+    for offset in range(4):
+        db_session.add(Title(source="tmdb", source_id=str(failing_id + offset), media_type="movie", name="Backfill"))
+    await db_session.commit()
+
+    in_flight = 0
+    peak = 0
+    seen: list[int] = []
+
+    async def fake_fetcher(*, tmdb_id, media_type):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        seen.append(tmdb_id)
+        if tmdb_id == failing_id:
+            raise RuntimeError("tmdb down")
+        return {"runtime_minutes": 90}
+
+    stats = await run_backfill(
+        db_session,
+        apply=False,
+        batch_size=50,
+        max_items=None,
+        sleep_ms=0,
+        fill_runtime=True,
+        fill_overview=False,
+        verbose=False,
+        concurrency=2,
+        details_fetcher=fake_fetcher,
+    )
+
+    assert set(range(failing_id, failing_id + 4)) <= set(seen)
+    assert peak == 2
+    assert stats.fetch_errors == 1
+    assert stats.would_update == len(seen) - 1
+    assert stats.updated == 0
+
+
+async def test_run_backfill_apply_writes_patches_in_bulk(db_session):
+    base_id = 950_000 + uuid.uuid4().int % 40_000
+    titles = [
+        Title(source="tmdb", source_id=str(base_id + offset), media_type="movie", name="Bulk", overview="  ")
+        for offset in range(3)
+    ]
+    db_session.add_all(titles)
+    await db_session.commit()
+    title_ids = [title.id for title in titles]
+
+    async def fake_fetcher(*, tmdb_id, media_type):
+        if base_id <= tmdb_id < base_id + 3:
+            return {"runtime_minutes": 100 + tmdb_id - base_id, "overview": f" Plot {tmdb_id} "}
+        return {}
+
+    stats = await run_backfill(
+        db_session,
+        apply=True,
+        batch_size=50,
+        max_items=None,
+        sleep_ms=0,
+        fill_runtime=True,
+        fill_overview=True,
+        verbose=False,
+        details_fetcher=fake_fetcher,
+    )
+
+    assert stats.updated == 3
+    rows = (
+        await db_session.execute(
+            sa.select(Title.source_id, Title.runtime_minutes, Title.overview).where(Title.id.in_(title_ids))
+        )
+    ).all()
+    assert sorted(rows) == [
+        (str(base_id + offset), 100 + offset, f"Plot {base_id + offset}") for offset in range(3)
+    ]
+
+
+async def test_run_backfill_stops_at_max_items_across_prefetched_batches(db_session):
+    base_id = 990_000 + uuid.uuid4().int % 5_000
+    db_session.add_all(
+        Title(source="tmdb", source_id=str(base_id + offset), media_type="movie", name="Capped") for offset in range(5)
+    )
+    await db_session.commit()
+
+    calls = 0
+
+    async def fake_fetcher(*, tmdb_id, media_type):
+        nonlocal calls
+        calls += 1
+        return {}
+
+    stats = await run_backfill(
+        db_session,
+        apply=False,
+        batch_size=2,
+        max_items=3,
+        sleep_ms=0,
+        fill_runtime=True,
+        fill_overview=False,
+        verbose=False,
+        details_fetcher=fake_fetcher,
+    )
+
+    assert stats.scanned == 3
+    assert calls == 3 - stats.skipped_invalid_source_id
+
+
+async def test_rate_limiter_allows_burst_then_spaces_requests():
+    now = 0.0
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        nonlocal now
+        sleeps.append(seconds)
+        now += seconds
+
+    limiter = RateLimiter(20, capacity=3, clock=lambda: now, sleep=fake_sleep)
+
+    for _ in range(3):
+        await limiter.wait()
+    assert sleeps == []
+
+    await limiter.wait()
+    await limiter.wait()
+    assert sleeps == pytest.approx([0.05, 0.05])
+
+    # Idle time refills the bucket, up to its capacity.
+    now += 10
+    sleeps.clear()
+    for _ in range(4):
+        await limiter.wait()
+    assert sleeps == pytest.approx([0.05])
+
+
+async def test_details_cache_reuses_answers_but_not_failures(tmp_path):
+    calls: list[int] = []
+
+    async def fake_fetcher(*, tmdb_id, media_type):
+        calls.append(tmdb_id)
+        return {} if tmdb_id == 2 else {"runtime_minutes": 90, "overview": "Plot"}
+
+    cache = DetailsCache(tmp_path / "tmdb.sqlite", ttl_seconds=60)
+    try:
+        cached = cache.wrap(fake_fetcher)
+        assert await cached(tmdb_id=1, media_type="movie") == {"runtime_minutes": 90, "overview": "Plot"}
+        assert await cached(tmdb_id=1, media_type="movie") == {"runtime_minutes": 90, "overview": "Plot"}
+        assert await cached(tmdb_id=2, media_type="movie") == {}
+        assert await cached(tmdb_id=2, media_type="movie") == {}
+    finally:
+        cache.close()
+
+    assert calls == [1, 2, 2]
+
+    reopened = DetailsCache(tmp_path / "tmdb.sqlite", ttl_seconds=0)
+    try:
+        assert reopened.get(tmdb_id=1, media_type="movie") is None
+    finally:
+        reopened.close()
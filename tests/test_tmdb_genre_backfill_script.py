@@ -0,0 +1,62 @@
+import uuid
+
+import sqlalchemy as sa
+
+from app.models.title import Title
+from scripts.backfill_tmdb_title_genre_ids import run_backfill
+
+
+async def test_run_genre_backfill_stores_answers_and_leaves_failures_null(db_session):
+    base_id = 880_000 + uuid.uuid4().int % 50_000
+    titles = [
+        Title(source="tmdb", source_id=str(base_id + offset), media_type="movie", name="Genres") for offset in range(3)
+    ]
+    db_session.add_all(titles)
+    await db_session.commit()
+    title_ids = [title.id for title in titles]
+
+    answers = {base_id: [18, 35], base_id + 1: []}
+
+    async def fake_fetcher(*, tmdb_id, media_type):
+        if tmdb_id == base_id + 2:
+            raise RuntimeError("tmdb down")
+        return answers.get(tmdb_id)
+
+    dry = await run_backfill(
+        db_session, apply=False, batch_size=2, max_items=None, verbose=False, genre_ids_fetcher=fake_fetcher
+    )
+    assert dry.updated == 0
+    assert dry.would_update >= 2
+
+    stats = await run_backfill(
+        db_session, apply=True, batch_size=2, max_items=None, verbose=False, genre_ids_fetcher=fake_fetcher
+    )
+    assert stats.updated == stats.would_update >= 2
+    assert stats.fetch_errors >= 1
+
+    rows = (
+        await db_session.execute(sa.select(Title.source_id, Title.tmdb_genre_ids).where(Title.id.in_(title_ids)))
+    ).all()
+    assert dict(rows) == {str(base_id): [18, 35], str(base_id + 1): [], str(base_id + 2): None}
+
+
+async def test_run_genre_backfill_stops_at_max_items(db_session):
+    base_id = 940_000 + uuid.uuid4().int % 5_000
+    db_session.add_all(
+        Title(source="tmdb", source_id=str(base_id + offset), media_type="movie", name="Capped") for offset in range(5)
+    )
+    await db_session.commit()
+
+    calls = 0
+
+    async def fake_fetcher(*, tmdb_id, media_type):
+        nonlocal calls
+        calls += 1
+        return None
+
+    stats = await run_backfill(
+        db_session, apply=False, batch_size=2, max_items=3, verbose=False, genre_ids_fetcher=fake_fetcher
+    )
+
+    assert stats.scanned == 3
+    assert calls == 3 - stats.skipped_invalid_source_id
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from types import SimpleNamespace
 from uuid import uuid4
 
+import httpx
 import pytest
 from redis.exceptions import ConnectionError
 from starlette.requests import Request
@@ -140,3 +143,253 @@ async def test_tmdb_cache_evicts_oldest_entry(monkeypatch):
 
     assert list(tmdb_service._CACHE) == ["second", "third"]
     tmdb_service._CACHE.clear()
+
+
+async def test_tmdb_cache_set_drops_expired_entries(monkeypatch):
+    now = 1_000.0
+    monkeypatch.setattr(tmdb_service.time, "time", lambda: now)
+    monkeypatch.setattr(tmdb_service, "_CACHE_EXPIRY", [])
+    tmdb_service._CACHE.clear()
+
+    tmdb_service._cache_set("short", 1, ttl=10)
+    tmdb_service._cache_set("long", 2)
+    tmdb_service._cache_set("short", 3, ttl=20)
+    now = 1_015.0
+    tmdb_service._cache_set("next", 4)
+
+    assert list(tmdb_service._CACHE) == ["long", "short", "next"]
+    now = 1_025.0
+    tmdb_service._cache_set("last", 5)
+
+    assert list(tmdb_service._CACHE) == ["long", "next", "last"]
+    tmdb_service._CACHE.clear()
+
+
+async def test_tmdb_concurrent_misses_share_one_request(monkeypatch):
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def fake_request(path, *, params, timeout):
+        del params, timeout
+        calls.append(path)
+        await release.wait()
+        return {"id": 1}
+
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_request", fake_request)
+
+    first = asyncio.ensure_future(tmdb_service._tmdb_api_get_json("/movie/1"))
+    second = asyncio.ensure_future(tmdb_service._tmdb_api_get_json("/movie/1"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == {"id": 1}
+    assert await second == {"id": 1}
+    assert calls == ["/movie/1"]
+    assert tmdb_service._INFLIGHT == {}
+
+
+async def test_tmdb_watch_page_fetches_are_coalesced(monkeypatch):
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def fake_get_text(path, *, params):
+        calls.append(f"{path}?locale={params['locale']}")
+        await release.wait()
+        return "<p>No providers</p>"
+
+    monkeypatch.setattr(tmdb_service, "_tmdb_web_get_text", fake_get_text)
+
+    pending = [
+        asyncio.ensure_future(
+            tmdb_service._fetch_tmdb_watch_page_streaming_links(
+                tmdb_id=7, media_type="movie", region="us"
+            )
+        )
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*pending) == [{}, {}]
+    assert calls == ["/movie/7/watch?locale=US"]
+    assert tmdb_service._INFLIGHT == {}
+
+
+async def test_tmdb_api_requests_are_bounded(monkeypatch):
+    monkeypatch.setattr(tmdb_service, "_TMDB_MAX_CONCURRENT_REQUESTS", 2)
+    monkeypatch.setattr(tmdb_service, "_api_semaphore", None)
+    active = 0
+    peak = 0
+
+    class FakeClient:
+        async def get(self, path, *, params, timeout):
+            nonlocal active, peak
+            del params, timeout
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"path": path})
+
+    monkeypatch.setattr(tmdb_service, "_get_api_client", lambda: FakeClient())
+
+    results = await asyncio.gather(
+        *[tmdb_service._tmdb_api_get_json(f"/movie/{idx}") for idx in range(6)]
+    )
+
+    assert [row["path"] for row in results] == [f"/movie/{idx}" for idx in range(6)]
+    assert peak == 2
+
+
+async def test_tmdb_search_cache_key_folds_case_width_and_spacing(monkeypatch):
+    calls: list[dict] = []
+
+    async def fake_get_json(path, *, params=None, timeout=6):
+        del timeout
+        calls.append({"path": path, **(params or {})})
+        return {"results": []}
+
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_get_json", fake_get_json)
+    tmdb_service._CACHE.clear()
+
+    assert await tmdb_service.tmdb_search_multi("Blade  Runner") == []
+    assert await tmdb_service.tmdb_search_multi("ｂｌａｄｅ runner ") == []
+
+    assert calls == [{"path": "/search/multi", "query": "Blade  Runner"}]
+    tmdb_service._CACHE.clear()
+
+
+async def test_tmdb_search_projects_movie_and_tv_rows(monkeypatch):
+    async def fake_get_json(path, *, params=None, timeout=6):
+        del path, params, timeout
+        return {
+            "results": [
+                {"media_type": "person", "id": 1, "name": "Someone"},
+                {
+                    "media_type": "movie",
+                    "id": 2,
+                    "original_title": "Arrival",
+                    "release_date": "2016-11-11",
+                    "genre_ids": [18, "x"],
+                },
+                {"media_type": "tv", "id": 3, "name": "Severance", "first_air_date": ""},
+                {"media_type": "movie", "id": None, "title": "Missing id"},
+            ]
+        }
+
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_get_json", fake_get_json)
+    tmdb_service._CACHE.clear()
+
+    rows = await tmdb_service.tmdb_search_multi("arrival")
+
+    assert rows == [
+        {
+            "tmdb_id": 2,
+            "media_type": "movie",
+            "title": "Arrival",
+            "year": 2016,
+            "poster_path": None,
+            "genre_ids": [18],
+        },
+        {
+            "tmdb_id": 3,
+            "media_type": "tv",
+            "title": "Severance",
+            "year": None,
+            "poster_path": None,
+            "genre_ids": [],
+        },
+    ]
+    tmdb_service._CACHE.clear()
+
+
+async def test_tmdb_details_failure_is_cached_briefly(monkeypatch):
+    calls: list[str] = []
+
+    async def failing_get_json(path, *, params=None, timeout=6):
+        del params, timeout
+        calls.append(path)
+        raise httpx.HTTPStatusError(
+            "not found",
+            request=httpx.Request("GET", "https://api.themoviedb.org/3" + path),
+            response=httpx.Response(404),
+        )
+
+    monkeypatch.setattr(tmdb_service.settings, "env", "dev")
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_get_json", failing_get_json)
+    tmdb_service._CACHE.clear()
+
+    assert await tmdb_service.fetch_tmdb_title_details(tmdb_id=404, media_type="movie") == {}
+    assert await tmdb_service.fetch_tmdb_title_details(tmdb_id=404, media_type="movie") == {}
+    assert calls == ["/movie/404"]
+
+    expires_at, _ = tmdb_service._CACHE["details:movie:404"]
+    assert expires_at - time.time() <= tmdb_service._NEGATIVE_TTL_SECONDS * (
+        1 + tmdb_service._TTL_JITTER
+    )
+    tmdb_service._CACHE.clear()
+
+
+async def test_tmdb_genre_ids_tell_empty_from_failed(monkeypatch):
+    async def fake_get_json(path, *, params=None, timeout=6):
+        del params, timeout
+        if path == "/movie/500":
+            raise httpx.HTTPStatusError(
+                "server error",
+                request=httpx.Request("GET", "https://api.themoviedb.org/3" + path),
+                response=httpx.Response(500),
+            )
+        if path == "/movie/1":
+            return {"genres": [{"id": 18, "name": "Drama"}, {"id": 10749, "name": "Romance"}]}
+        return {"genres": []}
+
+    monkeypatch.setattr(tmdb_service.settings, "env", "dev")
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_get_json", fake_get_json)
+    tmdb_service._CACHE.clear()
+
+    assert await tmdb_service.fetch_tmdb_title_genre_ids(tmdb_id=1, media_type="movie") == [18, 10749]
+    assert await tmdb_service.fetch_tmdb_title_genre_ids(tmdb_id=2, media_type="movie") == []
+    assert await tmdb_service.fetch_tmdb_title_genre_ids(tmdb_id=500, media_type="movie") is None
+    assert await tmdb_service.fetch_tmdb_title_genre_ids(tmdb_id=1, media_type="person") is None
+    tmdb_service._CACHE.clear()
+
+
+def test_tmdb_clients_are_not_shared_across_event_loops(monkeypatch):
+    monkeypatch.setattr(tmdb_service, "_api_client", None)
+
+    async def grab():
+        return tmdb_service._get_api_client(), tmdb_service._get_api_client()
+
+    first, again = asyncio.run(grab())
+    second, _ = asyncio.run(grab())
+
+    assert first is again
+    assert second is not first
+    for client in (first, second):
+        asyncio.run(client.aclose())
+
+
+async def test_tmdb_transient_failure_is_not_cached(monkeypatch):
+    calls: list[str] = []
+
+    async def unavailable_get_json(path, *, params=None, timeout=6):
+        del params, timeout
+        calls.append(path)
+        raise httpx.HTTPStatusError(
+            "unavailable",
+            request=httpx.Request("GET", "https://api.themoviedb.org/3" + path),
+            response=httpx.Response(503),
+        )
+
+    monkeypatch.setattr(tmdb_service.settings, "env", "dev")
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_get_json", unavailable_get_json)
+    tmdb_service._CACHE.clear()
+
+    assert await tmdb_service.fetch_tmdb_title_details(tmdb_id=503, media_type="movie") == {}
+    assert await tmdb_service.fetch_tmdb_title_details(tmdb_id=503, media_type="movie") == {}
+    assert await tmdb_service.fetch_tmdb_title_genre_ids(tmdb_id=503, media_type="movie") is None
+    assert await tmdb_service.fetch_tmdb_title_genre_ids(tmdb_id=503, media_type="movie") is None
+    assert calls == ["/movie/503"] * 4
+    assert "details:movie:503" not in tmdb_service._CACHE
+    assert "taxonomy:movie:503" not in tmdb_service._CACHE
+    tmdb_service._CACHE.clear()
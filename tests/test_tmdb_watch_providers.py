@@ -1,3 +1,7 @@
+import httpx
+import pytest
+
+from app.services import tmdb as tmdb_service
 from app.services.tmdb import (
     _dedupe_streaming_providers,
     _extract_direct_streaming_urls_from_watch_html,
@@ -99,3 +103,94 @@ def test_extract_direct_streaming_urls_from_watch_html_only_watch_links():
         "netflix": "https://www.netflix.com/title/80057281",
         "youtube tv": "https://tv.youtube.com/browse/UCLqUTxe",
     }
+
+
+def test_extract_direct_streaming_urls_reads_escaped_redirect_param():
+    html = (
+        '<a href="https://click.justwatch.com/a?cx=abc&amp;r=https%3A%2F%2Fwww.hulu.com%2Fwatch%2F1'
+        '&amp;uct_country=us" title="Watch Shogun on Hulu">Hulu</a>'
+        '<a href="https://click.justwatch.com/a?r=https%3A%2F%2Fwww.hulu.com%2Fwatch%2F2"'
+        ' title="Watch Shogun on Hulu">Hulu</a>'
+    )
+
+    out = _extract_direct_streaming_urls_from_watch_html(html)
+
+    assert out == {"hulu": "https://www.hulu.com/watch/1"}
+    assert _extract_direct_streaming_urls_from_watch_html("<p>No providers</p>") == {}
+
+
+def test_extract_direct_streaming_urls_matches_uppercase_host():
+    html = (
+        '<a href="https://Click.JustWatch.com/a?r=https%3A%2F%2Fwww.hulu.com%2Fwatch%2F1"'
+        ' title="Watch Shogun on Hulu">Hulu</a>'
+    )
+
+    out = _extract_direct_streaming_urls_from_watch_html(html)
+
+    assert out == {"hulu": "https://www.hulu.com/watch/1"}
+
+
+def _stub_watch_lookups(monkeypatch, *, api, page):
+    page_calls: list[int] = []
+
+    async def fake_get_json(path, *, params=None, timeout=6):
+        del params, timeout
+        return await api(path)
+
+    async def fake_page(*, tmdb_id, media_type, region):
+        del media_type, region
+        page_calls.append(tmdb_id)
+        return await page()
+
+    monkeypatch.setattr(tmdb_service.settings, "env", "dev")
+    monkeypatch.setattr(tmdb_service, "_tmdb_api_get_json", fake_get_json)
+    monkeypatch.setattr(tmdb_service, "_fetch_tmdb_watch_page_streaming_links", fake_page)
+    tmdb_service._CACHE.clear()
+    return page_calls
+
+
+async def test_watch_providers_skip_the_page_when_the_api_has_nothing(monkeypatch):
+    async def api(path):
+        if path.startswith("/movie/404/"):
+            raise httpx.HTTPStatusError(
+                "not found",
+                request=httpx.Request("GET", "https://api.themoviedb.org/3" + path),
+                response=httpx.Response(404),
+            )
+        return {"results": {"US": {"link": "https://www.themoviedb.org/movie/1/watch", "rent": []}}}
+
+    async def page():
+        return {}
+
+    page_calls = _stub_watch_lookups(monkeypatch, api=api, page=page)
+
+    missing = await tmdb_service.fetch_tmdb_watch_providers(tmdb_id=404, media_type="movie")
+    rent_only = await tmdb_service.fetch_tmdb_watch_providers(tmdb_id=1, media_type="movie")
+
+    assert missing["streaming_providers"] == []
+    assert rent_only["streaming_providers"] == []
+    assert page_calls == []
+    tmdb_service._CACHE.clear()
+
+
+async def test_watch_providers_survive_a_failed_page_but_not_a_bug(monkeypatch):
+    async def api(path):
+        del path
+        return {"results": {"US": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]}}}
+
+    async def failing_page():
+        raise httpx.ConnectError("page down")
+
+    _stub_watch_lookups(monkeypatch, api=api, page=failing_page)
+    out = await tmdb_service.fetch_tmdb_watch_providers(tmdb_id=2, media_type="movie")
+    assert [(row["provider_name"], row["streaming_url"]) for row in out["streaming_providers"]] == [
+        ("Netflix", None)
+    ]
+
+    async def broken_page():
+        raise RuntimeError("parser bug")
+
+    _stub_watch_lookups(monkeypatch, api=api, page=broken_page)
+    with pytest.raises(RuntimeError):
+        await tmdb_service.fetch_tmdb_watch_providers(tmdb_id=3, media_type="movie")
+    tmdb_service._CACHE.clear()
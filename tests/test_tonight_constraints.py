@@ -57,3 +57,13 @@ def test_structured_mood_cues_are_stable_and_limited():
         )
     with pytest.raises(ValidationError):
         TonightConstraints(custom_mood_text="x" * 241)
+
+
+def test_canonical_bytes_tracks_values_not_construction_order():
+    a = TonightConstraints(format="movie", moods=["Cozy"], max_runtime=120)
+    b = TonightConstraints(max_runtime=120, moods=["Cozy"], format="movie")
+    assert a.canonical_bytes() == b.canonical_bytes()
+    assert a.canonical_bytes() != TonightConstraints(format="movie").canonical_bytes()
+    assert TonightConstraints(ai_version=None).canonical_bytes() != TonightConstraints(
+        free_text="None"
+    ).canonical_bytes()
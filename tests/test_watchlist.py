@@ -1,6 +1,13 @@
+import base64
+import json
+import uuid
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
+import sqlalchemy as sa
+
+from app.models.title import Title
 
 
 @pytest.mark.anyio
@@ -32,20 +39,56 @@ async def test_tmdb_search_returns_compact_shape(async_client, monkeypatch, user
 
 
 @pytest.mark.anyio
-async def test_watchlist_membership_required(async_client, user_factory, login_helper):
-    # A creates group
+async def test_watchlist_membership_required(async_client, db_session, user_factory, login_helper):
+    # A creates a group with one item
     user_a = await user_factory(async_client, display_name="A1")
     await login_helper(async_client, email=user_a["email"], password=user_a["password"])
     r = await async_client.post("/groups", json={"name": "Solo"})
     assert r.status_code in (200, 201), r.text
     g = r.json()
     group_id = g["id"]
+    r = await async_client.post(
+        f"/groups/{group_id}/watchlist",
+        json={"type": "manual", "title": "Members Only", "year": 2020, "media_type": "movie"},
+    )
+    assert r.status_code == 201, r.text
+    item = r.json()
 
-    # B tries to access watchlist
+    # B tries to read and write it
     user_b = await user_factory(async_client, display_name="B1")
     await login_helper(async_client, email=user_b["email"], password=user_b["password"])
     r = await async_client.get(f"/groups/{group_id}/watchlist")
     assert r.status_code in (401, 403)
+    r = await async_client.get(f"/groups/{group_id}/watchlist", params={"paginate": "true"})
+    assert r.status_code == 403
+
+    r = await async_client.post(
+        f"/groups/{group_id}/watchlist",
+        json={"type": "manual", "title": "Intruder", "year": 2020, "media_type": "movie"},
+    )
+    assert r.status_code == 403
+
+    tmdb_id = 700_000 + uuid.uuid4().int % 100_000
+    r = await async_client.post(
+        f"/groups/{group_id}/watchlist",
+        json={"type": "tmdb", "tmdb_id": tmdb_id, "media_type": "movie", "title": "Nope", "year": 2001},
+    )
+    assert r.status_code == 403
+    titles = await db_session.execute(
+        sa.select(Title.id).where(Title.source == "tmdb", Title.source_id == str(tmdb_id))
+    )
+    assert titles.first() is None
+
+    for body in ({"status": "watched"}, {"remove": True}):
+        r = await async_client.patch(f"/watchlist-items/{item['id']}", json=body)
+        assert r.status_code == 403
+        r = await async_client.patch(f"/watchlist-items/{uuid.uuid4()}", json=body)
+        assert r.status_code == 404
+
+    # A's item is untouched
+    await login_helper(async_client, email=user_a["email"], password=user_a["password"])
+    r = await async_client.get(f"/groups/{group_id}/watchlist")
+    assert [(x["id"], x["status"]) for x in r.json()] == [(item["id"], item["status"])]
 
 
 @pytest.mark.anyio
@@ -95,6 +138,7 @@ async def test_watchlist_tmdb_add_and_duplicate_returns_existing(
     assert item1["title"]["release_year"] == 1999
     assert item1["title"]["poster_path"] == "/matrix.jpg"
     assert "email" not in item1["added_by_user"]
+    assert item1["added_by_user"]["display_name"] == "A"
     assert (group_id, "item_added") in broadcasts
 
     r2 = await async_client.post(f"/groups/{group_id}/watchlist", json=payload)
@@ -392,6 +436,13 @@ async def test_watchlist_paginated_query_and_load_more(async_client, user_factor
     assert second_data["next_cursor"] is None
     assert second_data["total_count"] == 3
 
+    past_end = await async_client.get(
+        f"/groups/{group_id}/watchlist",
+        params={"paginate": "true", "limit": 2, "cursor": "10"},
+    )
+    assert past_end.status_code == 200, past_end.text
+    assert past_end.json() == {"items": [], "next_cursor": None, "total_count": 3}
+
     oldest = await async_client.get(
         f"/groups/{group_id}/watchlist",
         params={"paginate": "true", "limit": 10, "sort": "oldest"},
@@ -410,19 +461,112 @@ async def test_watchlist_paginated_query_and_load_more(async_client, user_factor
     assert searched_data["items"][0]["title"]["name"] == "Alpha"
 
 
+@pytest.mark.anyio
+async def test_watchlist_garbage_cursor_restarts_at_first_page(async_client, user_factory, login_helper):
+    user = await user_factory(async_client, display_name="Garbage")
+    await login_helper(async_client, email=user["email"], password=user["password"])
+    group_id = (await async_client.post("/groups", json={"name": "G"})).json()["id"]
+
+    for title in ["Alpha", "Bravo", "Charlie"]:
+        r = await async_client.post(
+            f"/groups/{group_id}/watchlist",
+            json={"type": "manual", "title": title, "year": 2020, "media_type": "movie"},
+        )
+        assert r.status_code == 201, r.text
+
+    params = {"paginate": "true", "limit": 2, "sort": "recent"}
+    first = await async_client.get(f"/groups/{group_id}/watchlist", params=params)
+    assert first.status_code == 200, first.text
+    first_names = [row["title"]["name"] for row in first.json()["items"]]
+
+    infinite = b'{"s":"recent","n":Infinity,"k":"2020-01-01T00:00:00+00:00","id":"%s"}' % str(
+        uuid.uuid4()
+    ).encode()
+    garbage = ["\u00b2", base64.urlsafe_b64encode(infinite).decode().rstrip("="), "not-a-cursor", "9" * 5000]
+    for cursor in garbage:
+        r = await async_client.get(f"/groups/{group_id}/watchlist", params={**params, "cursor": cursor})
+        assert r.status_code == 200, (cursor[:20], r.text)
+        data = r.json()
+        assert data["total_count"] == 3
+        assert [row["title"]["name"] for row in data["items"]] == first_names
+
+
+@pytest.mark.anyio
+async def test_watchlist_keyset_cursor_skips_rows_added_between_pages(
+    async_client, user_factory, login_helper
+):
+    user = await user_factory(async_client, display_name="Keyset")
+    await login_helper(async_client, email=user["email"], password=user["password"])
+    group_id = (await async_client.post("/groups", json={"name": "G"})).json()["id"]
+
+    for title in ["Delta", "Alpha", "Charlie", "Bravo"]:
+        r = await async_client.post(
+            f"/groups/{group_id}/watchlist",
+            json={"type": "manual", "title": title, "year": 2020, "media_type": "movie"},
+        )
+        assert r.status_code == 201, r.text
+
+    async def collect(sort: str, *, limit: int, insert_after_first: bool = False) -> list[str]:
+        nonlocal expected_total
+        names: list[str] = []
+        cursor = None
+        while True:
+            params = {"paginate": "true", "limit": limit, "sort": sort}
+            if cursor:
+                params["cursor"] = cursor
+            r = await async_client.get(f"/groups/{group_id}/watchlist", params=params)
+            assert r.status_code == 200, r.text
+            data = r.json()
+            assert data["total_count"] == expected_total
+            names.extend(row["title"]["name"] for row in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return names
+            if insert_after_first:
+                insert_after_first = False
+                # Newer rows sort ahead of the cursor and must not shift the next page.
+                added = await async_client.post(
+                    f"/groups/{group_id}/watchlist",
+                    json={"type": "manual", "title": "Echo", "year": 2020, "media_type": "movie"},
+                )
+                assert added.status_code == 201, added.text
+                # The total covers the whole list, including rows that sort before the cursor.
+                expected_total += 1
+
+    expected_total = 4
+    assert await collect("alpha", limit=3) == ["Alpha", "Bravo", "Charlie", "Delta"]
+    assert await collect("recent", limit=2, insert_after_first=True) == [
+        "Bravo",
+        "Charlie",
+        "Alpha",
+        "Delta",
+    ]
+
+    # The served-row count in the cursor is client-controlled and must not feed the total.
+    first = await async_client.get(
+        f"/groups/{group_id}/watchlist", params={"paginate": "true", "limit": 2, "sort": "recent"}
+    )
+    raw = first.json()["next_cursor"]
+    payload = json.loads(base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)))
+    payload["n"] = 1000
+    spoofed = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    r = await async_client.get(
+        f"/groups/{group_id}/watchlist",
+        params={"paginate": "true", "limit": 2, "sort": "recent", "cursor": spoofed},
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["total_count"] == 5
+
+
 @pytest.mark.anyio
 async def test_watchlist_paginated_genre_filter(async_client, monkeypatch, user_factory, login_helper):
     from app.services import watchlist as watchlist_service
 
-    async def fake_taxonomy(*, tmdb_id: int, media_type: str):
+    async def fake_genre_ids(*, tmdb_id: int, media_type: str):
         _ = media_type
-        if tmdb_id == 1101:
-            return {"science fiction"}, set(), {878}
-        if tmdb_id == 1102:
-            return {"romance"}, set(), {10749}
-        return set(), set(), set()
+        return {1101: [878], 1102: [10749]}.get(tmdb_id, [])
 
-    monkeypatch.setattr(watchlist_service, "fetch_tmdb_title_taxonomy", fake_taxonomy)
+    monkeypatch.setattr(watchlist_service, "fetch_tmdb_title_genre_ids", fake_genre_ids)
 
     user = await user_factory(async_client, display_name="Genre")
     await login_helper(async_client, email=user["email"], password=user["password"])
@@ -447,3 +591,118 @@ async def test_watchlist_paginated_genre_filter(async_client, monkeypatch, user_
     assert data["total_count"] == 1
     assert len(data["items"]) == 1
     assert data["items"][0]["id"] == sci.json()["id"]
+
+
+@pytest.mark.anyio
+async def test_watchlist_genre_filter_reads_stored_genre_ids_only(
+    async_client, db_session, monkeypatch, user_factory, login_helper
+):
+    from app.services import watchlist as watchlist_service
+
+    known: dict[int, list[int]] = {}
+    lookups: list[int] = []
+
+    async def fake_genre_ids(*, tmdb_id: int, media_type: str):
+        _ = media_type
+        lookups.append(tmdb_id)
+        return known.get(tmdb_id)
+
+    monkeypatch.setattr(watchlist_service, "fetch_tmdb_title_genre_ids", fake_genre_ids)
+
+    user = await user_factory(async_client, display_name="Backfill")
+    await login_helper(async_client, email=user["email"], password=user["password"])
+    group_id = (await async_client.post("/groups", json={"name": "G"})).json()["id"]
+
+    # The lookup fails while the title is added, so its genre ids stay unknown.
+    older = await async_client.post(
+        f"/groups/{group_id}/watchlist",
+        json={"type": "tmdb", "tmdb_id": 1201, "media_type": "movie", "title": "Older", "year": 2001, "poster_path": None},
+    )
+    assert older.status_code == 201, older.text
+    # A successful lookup with no genres is stored as an empty list, not left NULL.
+    known[1202] = []
+    plain = await async_client.post(
+        f"/groups/{group_id}/watchlist",
+        json={"type": "tmdb", "tmdb_id": 1202, "media_type": "movie", "title": "Plain", "year": 2002, "poster_path": None},
+    )
+    assert plain.status_code == 201, plain.text
+    stored = dict(
+        (
+            await db_session.execute(
+                sa.select(Title.source_id, Title.tmdb_genre_ids).where(Title.source_id.in_(["1201", "1202"]))
+            )
+        ).all()
+    )
+    assert stored == {"1201": None, "1202": []}
+
+    known[1201] = [27]
+    lookups.clear()
+    params = {"paginate": "true", "genre_id": 27, "limit": 24}
+    r = await async_client.get(f"/groups/{group_id}/watchlist", params=params)
+    assert r.status_code == 200, r.text
+    assert r.json()["total_count"] == 0
+    assert lookups == []
+
+    # Older rows get their ids offline (scripts/), never from the list request.
+    await db_session.execute(
+        sa.update(Title).where(Title.source == "tmdb", Title.source_id == "1201").values(tmdb_genre_ids=[27])
+    )
+    await db_session.commit()
+
+    again = await async_client.get(f"/groups/{group_id}/watchlist", params=params)
+    assert again.status_code == 200, again.text
+    assert [row["id"] for row in again.json()["items"]] == [older.json()["id"]]
+
+
+@pytest.mark.anyio
+async def test_assert_user_in_group_memoizes_within_request_scope():
+    from app.services import watchlist as watchlist_service
+
+    class FakeDb:
+        def __init__(self):
+            self.calls = 0
+
+        async def execute(self, _query):
+            self.calls += 1
+            return SimpleNamespace(scalar_one_or_none=lambda: uuid.uuid4())
+
+    group_id, user_id = uuid.uuid4(), uuid.uuid4()
+    db = FakeDb()
+
+    await watchlist_service.assert_user_in_group(db, group_id, user_id)
+    await watchlist_service.assert_user_in_group(db, group_id, user_id)
+    assert db.calls == 2
+
+    token = watchlist_service.verified_memberships.set(set())
+    try:
+        await watchlist_service.assert_user_in_group(db, group_id, user_id)
+        await watchlist_service.assert_user_in_group(db, group_id, user_id)
+        await watchlist_service.assert_user_in_group(db, group_id, uuid.uuid4())
+    finally:
+        watchlist_service.verified_memberships.reset(token)
+    assert db.calls == 4
+
+
+@pytest.mark.anyio
+async def test_watchlist_tmdb_title_upsert_keeps_known_fields(async_client, user_factory, login_helper):
+    user = await user_factory(async_client, display_name="Upsert")
+    await login_helper(async_client, email=user["email"], password=user["password"])
+    first_group = (await async_client.post("/groups", json={"name": "One"})).json()["id"]
+    second_group = (await async_client.post("/groups", json={"name": "Two"})).json()["id"]
+
+    first = await async_client.post(
+        f"/groups/{first_group}/watchlist",
+        json={"type": "tmdb", "tmdb_id": 1301, "media_type": "movie", "title": "Heat", "year": 1995, "poster_path": "/old.jpg"},
+    )
+    assert first.status_code == 201, first.text
+
+    second = await async_client.post(
+        f"/groups/{second_group}/watchlist",
+        json={"type": "tmdb", "tmdb_id": 1301, "media_type": "movie", "title": "Heat (1995)", "poster_path": "/new.jpg"},
+    )
+    assert second.status_code == 201, second.text
+    title = second.json()["title"]
+    assert title["id"] == first.json()["title"]["id"]
+    assert title["name"] == "Heat (1995)"
+    assert title["release_year"] == 1995
+    assert title["poster_path"] == "/new.jpg"